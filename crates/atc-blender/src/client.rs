@@ -8,28 +8,36 @@ use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::time::Duration;
 
+/// base64url of `{"alg":"HS256","typ":"JWT"}`; the dummy header never changes.
+const DUMMY_JWT_HEADER_B64: &str = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9";
+/// base64url of `dummy`; Blender does not verify the signature.
+const DUMMY_JWT_SIGNATURE_B64: &str = "ZHVtbXk";
+
 /// Generate a dummy JWT token that Blender will accept.
 /// Blender with BYPASS_AUTH_TOKEN_VERIFICATION=1 still validates:
 /// - Token format (must be header.payload.signature)
 /// - Issuer (must be a valid URL)
 /// - Scopes (must include flightblender.write)
+///
+/// Called for every request when no token is configured, so only the
+/// timestamps are formatted per call.
 pub(crate) fn generate_dummy_jwt() -> String {
-    let header = serde_json::json!({"alg": "HS256", "typ": "JWT"});
     let now = Utc::now().timestamp();
-    let payload = serde_json::json!({
-        "iss": "https://atc-server.local",
-        "sub": "atc-server",
-        "aud": "testflight.flightblender.com",
-        "scope": "flightblender.read flightblender.write",
-        "exp": now + 3600,
-        "iat": now
-    });
-
-    let header_b64 = URL_SAFE_NO_PAD.encode(header.to_string().as_bytes());
-    let payload_b64 = URL_SAFE_NO_PAD.encode(payload.to_string().as_bytes());
-    let signature_b64 = URL_SAFE_NO_PAD.encode(b"dummy");
-
-    format!("{}.{}.{}", header_b64, payload_b64, signature_b64)
+    let payload = format!(
+        concat!(
+            r#"{{"aud":"testflight.flightblender.com","exp":{},"iat":{},"#,
+            r#""iss":"https://atc-server.local","#,
+            r#""scope":"flightblender.read flightblender.write","sub":"atc-server"}}"#,
+        ),
+        now + 3600,
+        now
+    );
+    let payload_b64 = URL_SAFE_NO_PAD.encode(payload.as_bytes());
+
+    format!(
+        "{}.{}.{}",
+        DUMMY_JWT_HEADER_B64, payload_b64, DUMMY_JWT_SIGNATURE_B64
+    )
 }
 
 /// HTTP client for Flight Blender API.
@@ -105,8 +113,10 @@ impl BlenderClient {
     }
 
     pub(crate) fn auth_header(&self) -> String {
-        let token = self.auth_token.clone().unwrap_or_else(generate_dummy_jwt);
-        format!("Bearer {}", token)
+        match self.auth_token.as_deref() {
+            Some(token) => format!("Bearer {}", token),
+            None => format!("Bearer {}", generate_dummy_jwt()),
+        }
     }
 
     /// Update auth token at runtime (OAuth refresh, rotation, etc.).
@@ -549,3 +559,33 @@ impl BlenderClient {
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use base64::Engine as _;
+
+    #[test]
+    fn dummy_jwt_has_expected_header_and_claims() {
+        let token = generate_dummy_jwt();
+        let parts: Vec<_> = token.split('.').collect();
+        assert_eq!(parts.len(), 3);
+
+        let header: Value =
+            serde_json::from_slice(&URL_SAFE_NO_PAD.decode(parts[0]).unwrap()).unwrap();
+        assert_eq!(header, serde_json::json!({"alg": "HS256", "typ": "JWT"}));
+
+        let claims: Value =
+            serde_json::from_slice(&URL_SAFE_NO_PAD.decode(parts[1]).unwrap()).unwrap();
+        assert_eq!(claims["iss"], "https://atc-server.local");
+        assert_eq!(claims["aud"], "testflight.flightblender.com");
+        assert!(claims["scope"]
+            .as_str()
+            .unwrap()
+            .contains("flightblender.write"));
+        assert_eq!(
+            claims["exp"].as_i64().unwrap() - claims["iat"].as_i64().unwrap(),
+            3600
+        );
+    }
+}
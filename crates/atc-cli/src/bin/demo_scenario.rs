@@ -346,7 +346,8 @@ async fn spawn_command_listener(
     Some(rx)
 }
 
-async fn handle_command(drone: &mut DemoState, cmd: Command) {
+/// `now` is the current tick instant, the clock hold expiry is checked against.
+async fn handle_command(drone: &mut DemoState, cmd: Command, now: time::Instant) {
     println!("\n  ╔════════════════════════════════════════════════════════════╗");
     println!("  ║  COMMAND: {:?}", cmd.command_type);
     println!("  ╚════════════════════════════════════════════════════════════╝");
@@ -354,8 +355,7 @@ async fn handle_command(drone: &mut DemoState, cmd: Command) {
     match cmd.command_type {
         CommandType::Hold { duration_secs } => {
             drone.is_holding = true;
-            drone.hold_until =
-                Some(time::Instant::now() + Duration::from_secs(duration_secs as u64));
+            drone.hold_until = Some(now + Duration::from_secs(duration_secs as u64));
             println!("  [CMD] {} HOLD for {}s\n", drone.drone_id, duration_secs);
         }
         CommandType::Resume => {
@@ -391,6 +391,192 @@ async fn handle_command(drone: &mut DemoState, cmd: Command) {
     let _ = drone.client.ack_command(&cmd.command_id).await;
 }
 
+/// Advance one drone by a tick: motion, phase, battery, telemetry and commands.
+async fn tick_drone(
+    drone: &mut DemoState,
+    now: time::Instant,
+    elapsed: f64,
+    dt: f64,
+    update_count: u32,
+    owner_id: &str,
+) {
+    // Check hold expiry
+    if let Some(until) = drone.hold_until {
+        if now >= until {
+            drone.is_holding = false;
+            drone.hold_until = None;
+        }
+    }
+
+    // Update phase
+    drone.update_phase(elapsed);
+
+    let (target_lat, target_lon, target_alt) =
+        if drone.is_rerouting && drone.reroute_index < drone.reroute_waypoints.len() {
+            drone.reroute_waypoints[drone.reroute_index]
+        } else {
+            (drone.end_lat, drone.end_lon, drone.current_alt)
+        };
+
+    let target_speed = if drone.is_holding
+        || matches!(
+            drone.phase,
+            FlightPhase::Preflight
+                | FlightPhase::Takeoff
+                | FlightPhase::Landing
+                | FlightPhase::Landed
+        ) {
+        0.0
+    } else {
+        DRONE_SPEED_MPS
+    };
+    drone.update_motion(target_lat, target_lon, dt, target_speed);
+
+    let lat = drone.current_lat;
+    let lon = drone.current_lon;
+
+    if drone.is_rerouting && drone.reroute_index < drone.reroute_waypoints.len() {
+        let target = drone.reroute_waypoints[drone.reroute_index];
+        let dist_to_target = haversine_distance(lat, lon, target.0, target.1);
+        if dist_to_target <= WAYPOINT_REACHED_M {
+            drone.current_lat = target.0;
+            drone.current_lon = target.1;
+            drone.current_alt = target.2;
+
+            drone.reroute_index += 1;
+            if drone.reroute_index >= drone.reroute_waypoints.len() {
+                drone.is_rerouting = false;
+                drone.reroute_waypoints.clear();
+                drone.reroute_index = 0;
+                println!(
+                    "[{:3}] {} reroute complete, continuing from new position",
+                    update_count, drone.drone_id
+                );
+            }
+        }
+    }
+
+    // Check if we reached destination (distance-based transition)
+    if drone.phase == FlightPhase::Cruise && !drone.is_rerouting && !drone.is_holding {
+        let dist_to_end = haversine_distance(lat, lon, drone.end_lat, drone.end_lon);
+        if dist_to_end < 10.0 {
+            // Within 10 meters
+            drone.phase = FlightPhase::Landing;
+            drone.phase_start_time = elapsed;
+            println!(
+                "[{:3}] {} arrived at destination, starting landing",
+                update_count, drone.drone_id
+            );
+        }
+    }
+
+    // Calculate altitude with offset applied during cruise
+    let alt = if drone.is_rerouting && drone.reroute_index < drone.reroute_waypoints.len() {
+        // During reroute: use waypoint altitude + any additional offset
+        target_alt + drone.altitude_offset_m
+    } else if drone.phase == FlightPhase::Cruise {
+        // Normal cruise: apply offset to cruise altitude
+        drone.current_alt + drone.altitude_offset_m
+    } else {
+        // Takeoff/landing: use phase altitude (no offset during transitions)
+        drone.current_alt
+    };
+
+    let speed = drone.current_speed_mps;
+
+    let airborne = !matches!(drone.phase, FlightPhase::Preflight | FlightPhase::Landed);
+    drone.drain_battery(dt, speed, airborne);
+
+    if drone.battery_remaining_min <= drone.battery_reserve_min {
+        if !drone.battery_warned {
+            drone.battery_warned = true;
+            println!(
+                "[{:3}] {} battery reserve reached ({:.1} min left), forcing landing",
+                update_count, drone.drone_id, drone.battery_remaining_min
+            );
+        }
+        if matches!(
+            drone.phase,
+            FlightPhase::Cruise | FlightPhase::Takeoff | FlightPhase::Preflight
+        ) {
+            drone.is_holding = false;
+            drone.is_rerouting = false;
+            drone.phase = FlightPhase::Landing;
+            drone.phase_start_time = elapsed;
+        }
+    }
+
+    // Send telemetry with owner ID
+    match drone
+        .client
+        .send_position_with_owner(
+            lat,
+            lon,
+            alt,
+            drone.heading_deg,
+            speed,
+            Some(owner_id.to_string()),
+        )
+        .await
+    {
+        Ok(_) => {
+            let status = if drone.is_rerouting {
+                format!(
+                    "REROUTE[{}/{}]",
+                    drone.reroute_index + 1,
+                    drone.reroute_waypoints.len()
+                )
+            } else if drone.is_holding {
+                "HOLD".to_string()
+            } else {
+                format!("{}", drone.phase)
+            };
+
+            println!(
+                "[{:3}] {}: ({:.6}, {:.6}) @ {:.0}m | {}",
+                update_count, drone.drone_id, lat, lon, alt, status
+            );
+        }
+        Err(e) => eprintln!("[{:3}] {} ERROR: {}", update_count, drone.drone_id, e),
+    }
+
+    let mut poll_fallback = drone.command_rx.is_none();
+    let mut received_commands = Vec::new();
+    let mut disconnected = false;
+
+    if let Some(rx) = drone.command_rx.as_mut() {
+        loop {
+            match rx.try_recv() {
+                Ok(cmd) => received_commands.push(cmd),
+                Err(TryRecvError::Empty) => break,
+                Err(TryRecvError::Disconnected) => {
+                    disconnected = true;
+                    break;
+                }
+            }
+        }
+    }
+
+    if disconnected {
+        eprintln!(
+            "[CMD] {} command stream disconnected, falling back to polling",
+            drone.drone_id
+        );
+        drone.command_rx = None;
+        poll_fallback = true;
+    }
+
+    for cmd in received_commands {
+        handle_command(drone, cmd, now).await;
+    }
+
+    if poll_fallback {
+        if let Ok(Some(cmd)) = drone.client.get_next_command().await {
+            handle_command(drone, cmd, now).await;
+        }
+    }
+}
+
 #[tokio::main]
 async fn main() -> anyhow::Result<()> {
     let args = Args::parse();
@@ -444,8 +630,10 @@ async fn main() -> anyhow::Result<()> {
     println!();
 
     // Create and register drones
-    let mut alpha_client = AtcClient::new(&args.url);
-    let mut beta_client = AtcClient::new(&args.url);
+    // One HTTP pool for both drones; their per-tick requests run concurrently.
+    let http = reqwest::Client::new();
+    let mut alpha_client = AtcClient::with_http_client(&args.url, http.clone());
+    let mut beta_client = AtcClient::with_http_client(&args.url, http);
 
     println!("[REGISTER] Registering drones...");
     alpha_client.set_registration_token(Some(registration_token.clone()));
@@ -513,11 +701,16 @@ async fn main() -> anyhow::Result<()> {
     let owner_id = args.owner.clone(); // For telemetry owner tracking
     let mut update_count = 0u32;
     let mut interval = time::interval(Duration::from_secs_f64(1.0 / UPDATE_RATE_HZ));
+    // A slow tick should not be followed by a burst of catch-up ticks; drop the
+    // missed ones and stay on the original schedule.
+    interval.set_missed_tick_behavior(time::MissedTickBehavior::Skip);
     let mut last_elapsed = 0.0;
 
     loop {
-        interval.tick().await;
-        let elapsed = start_time.elapsed().as_secs_f64();
+        // Anchor the whole iteration on the tick deadline so the phase clock
+        // and hold expiry cannot disagree with each other.
+        let now = interval.tick().await;
+        let elapsed = now.duration_since(start_time).as_secs_f64();
         let dt = (elapsed - last_elapsed).max(0.0);
         last_elapsed = elapsed;
 
@@ -533,183 +726,12 @@ async fn main() -> anyhow::Result<()> {
 
         update_count += 1;
 
-        for drone in [&mut alpha, &mut beta] {
-            // Check hold expiry
-            if let Some(until) = drone.hold_until {
-                if time::Instant::now() >= until {
-                    drone.is_holding = false;
-                    drone.hold_until = None;
-                }
-            }
-
-            // Update phase
-            drone.update_phase(elapsed);
-
-            let (target_lat, target_lon, target_alt) =
-                if drone.is_rerouting && drone.reroute_index < drone.reroute_waypoints.len() {
-                    drone.reroute_waypoints[drone.reroute_index]
-                } else {
-                    (drone.end_lat, drone.end_lon, drone.current_alt)
-                };
-
-            let target_speed = if drone.is_holding
-                || matches!(
-                    drone.phase,
-                    FlightPhase::Preflight
-                        | FlightPhase::Takeoff
-                        | FlightPhase::Landing
-                        | FlightPhase::Landed
-                ) {
-                0.0
-            } else {
-                DRONE_SPEED_MPS
-            };
-            drone.update_motion(target_lat, target_lon, dt, target_speed);
-
-            let lat = drone.current_lat;
-            let lon = drone.current_lon;
-
-            if drone.is_rerouting && drone.reroute_index < drone.reroute_waypoints.len() {
-                let target = drone.reroute_waypoints[drone.reroute_index];
-                let dist_to_target = haversine_distance(lat, lon, target.0, target.1);
-                if dist_to_target <= WAYPOINT_REACHED_M {
-                    drone.current_lat = target.0;
-                    drone.current_lon = target.1;
-                    drone.current_alt = target.2;
-
-                    drone.reroute_index += 1;
-                    if drone.reroute_index >= drone.reroute_waypoints.len() {
-                        drone.is_rerouting = false;
-                        drone.reroute_waypoints.clear();
-                        drone.reroute_index = 0;
-                        println!(
-                            "[{:3}] {} reroute complete, continuing from new position",
-                            update_count, drone.drone_id
-                        );
-                    }
-                }
-            }
-
-            // Check if we reached destination (distance-based transition)
-            if drone.phase == FlightPhase::Cruise && !drone.is_rerouting && !drone.is_holding {
-                let dist_to_end = haversine_distance(lat, lon, drone.end_lat, drone.end_lon);
-                if dist_to_end < 10.0 {
-                    // Within 10 meters
-                    drone.phase = FlightPhase::Landing;
-                    drone.phase_start_time = elapsed;
-                    println!(
-                        "[{:3}] {} arrived at destination, starting landing",
-                        update_count, drone.drone_id
-                    );
-                }
-            }
-
-            // Calculate altitude with offset applied during cruise
-            let alt = if drone.is_rerouting && drone.reroute_index < drone.reroute_waypoints.len() {
-                // During reroute: use waypoint altitude + any additional offset
-                target_alt + drone.altitude_offset_m
-            } else if drone.phase == FlightPhase::Cruise {
-                // Normal cruise: apply offset to cruise altitude
-                drone.current_alt + drone.altitude_offset_m
-            } else {
-                // Takeoff/landing: use phase altitude (no offset during transitions)
-                drone.current_alt
-            };
-
-            let speed = drone.current_speed_mps;
-
-            let airborne = !matches!(drone.phase, FlightPhase::Preflight | FlightPhase::Landed);
-            drone.drain_battery(dt, speed, airborne);
-
-            if drone.battery_remaining_min <= drone.battery_reserve_min {
-                if !drone.battery_warned {
-                    drone.battery_warned = true;
-                    println!(
-                        "[{:3}] {} battery reserve reached ({:.1} min left), forcing landing",
-                        update_count, drone.drone_id, drone.battery_remaining_min
-                    );
-                }
-                if matches!(
-                    drone.phase,
-                    FlightPhase::Cruise | FlightPhase::Takeoff | FlightPhase::Preflight
-                ) {
-                    drone.is_holding = false;
-                    drone.is_rerouting = false;
-                    drone.phase = FlightPhase::Landing;
-                    drone.phase_start_time = elapsed;
-                }
-            }
-
-            // Send telemetry with owner ID
-            match drone
-                .client
-                .send_position_with_owner(
-                    lat,
-                    lon,
-                    alt,
-                    drone.heading_deg,
-                    speed,
-                    Some(owner_id.clone()),
-                )
-                .await
-            {
-                Ok(_) => {
-                    let status = if drone.is_rerouting {
-                        format!(
-                            "REROUTE[{}/{}]",
-                            drone.reroute_index + 1,
-                            drone.reroute_waypoints.len()
-                        )
-                    } else if drone.is_holding {
-                        "HOLD".to_string()
-                    } else {
-                        format!("{}", drone.phase)
-                    };
-
-                    println!(
-                        "[{:3}] {}: ({:.6}, {:.6}) @ {:.0}m | {}",
-                        update_count, drone.drone_id, lat, lon, alt, status
-                    );
-                }
-                Err(e) => eprintln!("[{:3}] {} ERROR: {}", update_count, drone.drone_id, e),
-            }
-
-            let mut poll_fallback = drone.command_rx.is_none();
-            let mut received_commands = Vec::new();
-            let mut disconnected = false;
-
-            if let Some(rx) = drone.command_rx.as_mut() {
-                loop {
-                    match rx.try_recv() {
-                        Ok(cmd) => received_commands.push(cmd),
-                        Err(TryRecvError::Empty) => break,
-                        Err(TryRecvError::Disconnected) => {
-                            disconnected = true;
-                            break;
-                        }
-                    }
-                }
-            }
-
-            if disconnected {
-                eprintln!(
-                    "[CMD] {} command stream disconnected, falling back to polling",
-                    drone.drone_id
-                );
-                drone.command_rx = None;
-                poll_fallback = true;
-            }
-
-            for cmd in received_commands {
-                handle_command(drone, cmd).await;
-            }
-
-            if poll_fallback {
-                if let Ok(Some(cmd)) = drone.client.get_next_command().await {
-                    handle_command(drone, cmd).await;
-                }
-            }
-        }
+        // Drones advance independently, so their telemetry and command
+        // round-trips overlap instead of queueing behind each other.
+        tokio::join!(
+            tick_drone(&mut alpha, now, elapsed, dt, update_count, &owner_id),
+            tick_drone(&mut beta, now, elapsed, dt, update_count, &owner_id),
+        );
     }
 
     Ok(())
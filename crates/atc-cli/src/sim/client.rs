@@ -2,40 +2,100 @@
 
 use anyhow::{Context, Result};
 use reqwest::blocking::Client;
-use serde::Serialize;
-use std::time::{SystemTime, UNIX_EPOCH};
+use serde::{Serialize, Serializer};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
+
+/// Idle keep-alive connections kept per host; sized for multi-drone sims
+/// that post for every drone on every tick.
+const POOL_MAX_IDLE_PER_HOST: usize = 64;
+
+/// One drone's position for a batched [`BlenderClient::send_observations`] call.
+#[derive(Debug, Clone, Copy)]
+pub struct TrackPoint<'a> {
+    /// Unique drone identifier (ICAO address)
+    pub drone_id: &'a str,
+    /// Latitude in decimal degrees
+    pub lat: f64,
+    /// Longitude in decimal degrees
+    pub lon: f64,
+    /// Altitude in meters
+    pub altitude_m: f64,
+    /// Heading in degrees (0 = North)
+    pub heading: f64,
+    /// Speed in meters per second
+    pub speed_mps: f64,
+}
 
 /// Observation sent to Flight Blender.
+///
+/// String fields borrow so building a payload per tick does not allocate.
 #[derive(Debug, Serialize)]
-struct Observation {
+struct Observation<'a> {
     lat_dd: f64,
     lon_dd: f64,
     altitude_mm: i64,
-    icao_address: String,
+    icao_address: &'a str,
     traffic_source: i32,
     source_type: i32,
     timestamp: i64,
-    metadata: ObservationMetadata,
+    metadata: ObservationMetadata<'a>,
+}
+
+impl<'a> Observation<'a> {
+    fn from_point(point: &TrackPoint<'a>, timestamp: i64) -> Self {
+        Self {
+            lat_dd: point.lat,
+            lon_dd: point.lon,
+            altitude_mm: (point.altitude_m * 1000.0) as i64,
+            icao_address: point.drone_id,
+            traffic_source: 1, // ADS-B
+            source_type: 1,
+            timestamp,
+            metadata: ObservationMetadata {
+                heading: point.heading,
+                speed_mps: point.speed_mps,
+                aircraft_type: "UAV",
+            },
+        }
+    }
 }
 
 #[derive(Debug, Serialize)]
-struct ObservationMetadata {
+struct ObservationMetadata<'a> {
     heading: f64,
     speed_mps: f64,
-    aircraft_type: String,
+    aircraft_type: &'a str,
 }
 
-#[derive(Debug, Serialize)]
-struct ObservationRequest {
-    observations: Vec<Observation>,
+/// A tick's observations, serialized straight from the caller's points so
+/// no intermediate list of observations is built per request.
+struct ObservationBatch<'a> {
+    points: &'a [TrackPoint<'a>],
+    timestamp: i64,
+}
+
+impl Serialize for ObservationBatch<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> std::result::Result<S::Ok, S::Error> {
+        serializer.collect_seq(
+            self.points
+                .iter()
+                .map(|point| Observation::from_point(point, self.timestamp)),
+        )
+    }
+}
+
+#[derive(Serialize)]
+struct ObservationRequest<'a> {
+    observations: ObservationBatch<'a>,
 }
 
 /// HTTP client for sending telemetry to Flight Blender.
 pub struct BlenderClient {
     client: Client,
-    base_url: String,
-    session_id: String,
-    token: String,
+    /// `set_air_traffic` endpoint for the session, built once.
+    observations_url: String,
+    /// Pre-formatted `Authorization` header value.
+    auth_header: String,
 }
 
 impl BlenderClient {
@@ -51,10 +111,18 @@ impl BlenderClient {
         token: impl Into<String>,
     ) -> Self {
         Self {
-            client: Client::new(),
-            base_url: base_url.into(),
-            session_id: session_id.into(),
-            token: token.into(),
+            client: Client::builder()
+                .timeout(Duration::from_secs(5))
+                .pool_max_idle_per_host(POOL_MAX_IDLE_PER_HOST)
+                .tcp_keepalive(Duration::from_secs(60))
+                .build()
+                .unwrap_or_else(|_| Client::new()),
+            observations_url: format!(
+                "{}/flight_stream/set_air_traffic/{}",
+                base_url.into(),
+                session_id.into()
+            ),
+            auth_header: format!("Bearer {}", token.into()),
         }
     }
 
@@ -79,42 +147,95 @@ impl BlenderClient {
         heading: f64,
         speed_mps: f64,
     ) -> Result<u16> {
-        let url = format!(
-            "{}/flight_stream/set_air_traffic/{}",
-            self.base_url, self.session_id
-        );
-
-        let timestamp = SystemTime::now()
-            .duration_since(UNIX_EPOCH)
-            .context("Failed to get current time")?
-            .as_secs() as i64;
+        let point = TrackPoint {
+            drone_id,
+            lat,
+            lon,
+            altitude_m,
+            heading,
+            speed_mps,
+        };
+        self.send_observations(std::slice::from_ref(&point))
+    }
 
+    /// Send one tick of observations for several drones in a single request.
+    ///
+    /// `set_air_traffic` accepts a list, so a multi-drone tick costs one round
+    /// trip instead of one per drone. All points share the same timestamp.
+    ///
+    /// # Returns
+    /// HTTP status code
+    pub fn send_observations(&self, points: &[TrackPoint<'_>]) -> Result<u16> {
         let request = ObservationRequest {
-            observations: vec![Observation {
-                lat_dd: lat,
-                lon_dd: lon,
-                altitude_mm: (altitude_m * 1000.0) as i64,
-                icao_address: drone_id.to_string(),
-                traffic_source: 1, // ADS-B
-                source_type: 1,
-                timestamp,
-                metadata: ObservationMetadata {
-                    heading,
-                    speed_mps,
-                    aircraft_type: "UAV".to_string(),
-                },
-            }],
+            observations: ObservationBatch {
+                points,
+                timestamp: unix_timestamp()?,
+            },
         };
 
         let response = self
             .client
-            .post(&url)
+            .post(&self.observations_url)
             .header("Content-Type", "application/json")
-            .header("Authorization", format!("Bearer {}", self.token))
+            .header("Authorization", &self.auth_header)
             .json(&request)
             .send()
             .context("Failed to send observation")?;
 
-        Ok(response.status().as_u16())
+        let status = response.status().as_u16();
+        // Drain the body so the connection goes back to the pool for the next tick.
+        let _ = response.bytes();
+        Ok(status)
+    }
+}
+
+fn unix_timestamp() -> Result<i64> {
+    Ok(SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .context("Failed to get current time")?
+        .as_secs() as i64)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_batch_serializes_every_point_with_shared_timestamp() {
+        let points = [
+            TrackPoint {
+                drone_id: "DRONE001",
+                lat: 33.0,
+                lon: -117.0,
+                altitude_m: 50.0,
+                heading: 90.0,
+                speed_mps: 10.0,
+            },
+            TrackPoint {
+                drone_id: "DRONE002",
+                lat: 33.1,
+                lon: -117.1,
+                altitude_m: 60.5,
+                heading: 270.0,
+                speed_mps: 12.0,
+            },
+        ];
+        let request = ObservationRequest {
+            observations: ObservationBatch {
+                points: &points,
+                timestamp: 1_700_000_000,
+            },
+        };
+
+        let value = serde_json::to_value(&request).unwrap();
+        let observations = value["observations"].as_array().unwrap();
+
+        assert_eq!(observations.len(), 2);
+        assert_eq!(observations[0]["icao_address"], "DRONE001");
+        assert_eq!(observations[1]["altitude_mm"], 60_500);
+        assert_eq!(observations[1]["metadata"]["aircraft_type"], "UAV");
+        assert!(observations
+            .iter()
+            .all(|obs| obs["timestamp"] == 1_700_000_000));
     }
 }
@@ -7,8 +7,9 @@ mod client;
 mod paths;
 mod scenarios;
 
-pub use client::BlenderClient;
+pub use client::{BlenderClient, TrackPoint};
 pub use paths::{CircularPath, FlightPath, LinearPath};
 pub use scenarios::{
-    create_converging_scenario, create_crossing_scenario, create_parallel_scenario, Scenario,
+    create_converging_scenario, create_converging_scenario_n, create_crossing_scenario,
+    create_parallel_scenario, Scenario,
 };
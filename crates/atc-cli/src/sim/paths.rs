@@ -1,6 +1,6 @@
 //! Flight path implementations.
 
-use atc_core::spatial::{bearing, haversine_distance, offset_by_bearing};
+use atc_core::spatial::{bearing, haversine_distance, GreatCircleOrigin, EARTH_RADIUS_M};
 use std::f64::consts::PI;
 
 /// Trait for flight path implementations.
@@ -47,6 +47,12 @@ pub struct CircularPath {
     pub start_angle: f64,
     pub clockwise: bool,
     period: f64,
+    origin: GreatCircleOrigin,
+    // Bearing at t = 0 and angular rate, with the direction sign folded in.
+    bearing0: f64,
+    omega: f64,
+    sin_ad: f64,
+    cos_ad: f64,
 }
 
 impl CircularPath {
@@ -71,6 +77,8 @@ impl CircularPath {
     ) -> Self {
         let circumference = 2.0 * PI * radius_m;
         let period = circumference / speed_mps;
+        let direction = if clockwise { -1.0 } else { 1.0 };
+        let angular_distance = radius_m / EARTH_RADIUS_M;
 
         Self {
             center_lat,
@@ -81,19 +89,25 @@ impl CircularPath {
             start_angle,
             clockwise,
             period,
+            origin: GreatCircleOrigin::new(center_lat, center_lon),
+            bearing0: direction * start_angle,
+            omega: direction * 2.0 * PI / period,
+            sin_ad: angular_distance.sin(),
+            cos_ad: angular_distance.cos(),
         }
     }
 }
 
 impl FlightPath for CircularPath {
     fn get_position(&self, t: f64) -> (f64, f64, f64) {
-        let mut angle_rad = self.start_angle + (2.0 * PI * t / self.period);
-        if self.clockwise {
-            angle_rad = -angle_rad;
+        if self.radius_m.abs() <= f64::EPSILON {
+            return (self.center_lat, self.center_lon, self.altitude_m);
         }
 
-        let (lat, lon) =
-            offset_by_bearing(self.center_lat, self.center_lon, self.radius_m, angle_rad);
+        let (sin_b, cos_b) = (self.bearing0 + self.omega * t).sin_cos();
+        let (lat, lon) = self
+            .origin
+            .offset_sin_cos(self.sin_ad, self.cos_ad, sin_b, cos_b);
 
         (lat, lon, self.altitude_m)
     }
@@ -114,7 +128,9 @@ pub struct LinearPath {
     pub distance_m: f64,
     pub duration: f64,
     heading_deg: f64,
-    heading_rad: f64,
+    origin: GreatCircleOrigin,
+    sin_heading: f64,
+    cos_heading: f64,
 }
 
 impl LinearPath {
@@ -151,7 +167,9 @@ impl LinearPath {
             distance_m,
             duration,
             heading_deg,
-            heading_rad,
+            origin: GreatCircleOrigin::new(start_lat, start_lon),
+            sin_heading: heading_rad.sin(),
+            cos_heading: heading_rad.cos(),
         }
     }
 }
@@ -166,8 +184,17 @@ impl FlightPath for LinearPath {
         };
 
         let distance = self.distance_m * progress;
-        let (lat, lon) =
-            offset_by_bearing(self.start_lat, self.start_lon, distance, self.heading_rad);
+        if distance.abs() <= f64::EPSILON {
+            return (self.start_lat, self.start_lon, self.altitude_m);
+        }
+
+        let angular_distance = distance / EARTH_RADIUS_M;
+        let (lat, lon) = self.origin.offset_sin_cos(
+            angular_distance.sin(),
+            angular_distance.cos(),
+            self.sin_heading,
+            self.cos_heading,
+        );
 
         (lat, lon, self.altitude_m)
     }
@@ -186,6 +213,7 @@ impl FlightPath for LinearPath {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use atc_core::spatial::offset_by_bearing;
 
     #[test]
     fn test_linear_path_start_position() {
@@ -217,4 +245,43 @@ mod tests {
         assert!((lat1 - lat2).abs() < 0.0001);
         assert!((lon1 - lon2).abs() < 0.0001);
     }
+
+    #[test]
+    fn test_linear_path_matches_offset_by_bearing() {
+        let path = LinearPath::new(33.0, -117.0, 34.0, -118.0, 50.0, 10.0);
+        let heading_rad = bearing(33.0, -117.0, 34.0, -118.0);
+
+        for t in [
+            1.0,
+            path.duration * 0.25,
+            path.duration * 0.5,
+            path.duration,
+        ] {
+            let (lat, lon, _) = path.get_position(t);
+            let distance = path.distance_m * (t / path.duration).clamp(0.0, 1.0);
+            let (exp_lat, exp_lon) = offset_by_bearing(33.0, -117.0, distance, heading_rad);
+
+            assert!((lat - exp_lat).abs() < 1e-12);
+            assert!((lon - exp_lon).abs() < 1e-12);
+        }
+    }
+
+    #[test]
+    fn test_circular_path_matches_offset_by_bearing() {
+        for clockwise in [false, true] {
+            let path = CircularPath::new(33.0, -117.0, 200.0, 50.0, 10.0, 0.5, clockwise);
+
+            for t in [0.0, 3.0, path.period * 0.3, path.period * 0.8] {
+                let mut angle = 0.5 + 2.0 * PI * t / path.period;
+                if clockwise {
+                    angle = -angle;
+                }
+                let (lat, lon, _) = path.get_position(t);
+                let (exp_lat, exp_lon) = offset_by_bearing(33.0, -117.0, 200.0, angle);
+
+                assert!((lat - exp_lat).abs() < 1e-12);
+                assert!((lon - exp_lon).abs() < 1e-12);
+            }
+        }
+    }
 }
@@ -1,7 +1,8 @@
 //! Pre-defined drone flight scenarios for testing.
 
 use super::paths::LinearPath;
-use atc_core::spatial::offset_by_bearing;
+use atc_core::spatial::{offset_by_bearing, GreatCircleOrigin, EARTH_RADIUS_M};
+use std::f64::consts::PI;
 use std::sync::Arc;
 
 use super::FlightPath;
@@ -104,16 +105,24 @@ pub fn create_parallel_scenario(center_lat: f64, center_lon: f64) -> Scenario {
 
 /// Create multiple drones converging on a central point.
 pub fn create_converging_scenario(center_lat: f64, center_lon: f64) -> Scenario {
+    // 4 drones from cardinal directions
+    create_converging_scenario_n(center_lat, center_lon, 4)
+}
+
+/// Create `n` drones evenly spaced on a ring, all flying to the center.
+///
+/// Every start point is the same distance from the same center, so the
+/// center and ring-radius trig is computed once rather than per drone.
+pub fn create_converging_scenario_n(center_lat: f64, center_lon: f64, n: usize) -> Scenario {
     let offset_m = 300.0;
-    let angles: [f64; 4] = [0.0, 90.0, 180.0, 270.0]; // 4 drones from cardinal directions
+    let center = GreatCircleOrigin::new(center_lat, center_lon);
+    let (sin_ad, cos_ad) = (offset_m / EARTH_RADIUS_M).sin_cos();
+    let step = 2.0 * PI / n as f64;
 
-    let drones: Vec<_> = angles
-        .iter()
-        .enumerate()
-        .map(|(i, &angle)| {
-            let angle_rad = angle.to_radians();
-            let (start_lat, start_lon) =
-                offset_by_bearing(center_lat, center_lon, offset_m, angle_rad);
+    let drones: Vec<_> = (0..n)
+        .map(|i| {
+            let (sin_b, cos_b) = (step * i as f64).sin_cos();
+            let (start_lat, start_lon) = center.offset_sin_cos(sin_ad, cos_ad, sin_b, cos_b);
 
             let path = Arc::new(LinearPath::new(
                 start_lat, start_lon, center_lat, center_lon, 50.0, 8.0,
@@ -146,4 +155,17 @@ mod tests {
         assert_eq!(scenario.drones.len(), 4);
         assert_eq!(scenario.name, "converging");
     }
+
+    #[test]
+    fn test_converging_scenario_n_starts_on_ring() {
+        let scenario = create_converging_scenario_n(33.0, -117.0, 6);
+        assert_eq!(scenario.drones.len(), 6);
+        assert_eq!(scenario.drones[5].0, "DRONE006");
+
+        for (_, path) in &scenario.drones {
+            let (lat, lon, _) = path.get_position(0.0);
+            let dist = atc_core::spatial::haversine_distance(33.0, -117.0, lat, lon);
+            assert!((dist - 300.0).abs() < 0.01);
+        }
+    }
 }
@@ -3,12 +3,22 @@
 //! Provides real-time conflict detection with lookahead prediction
 //! for multiple drones operating in the same airspace.
 
+use crate::spatial::EARTH_RADIUS_M;
 use serde::{Deserialize, Serialize};
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::time::{SystemTime, UNIX_EPOCH};
 
 const METERS_PER_DEG_LAT: f64 = 111_320.0;
 const CPA_EPS: f64 = 1e-9;
+/// Below this many tracked drones a detection pass runs on the calling thread.
+const PARALLEL_MIN_DRONES: usize = 512;
+/// Below this many tracked drones every pair is checked directly; bucketing
+/// costs more than the pairs it would skip.
+const GRID_MIN_DRONES: usize = 32;
+/// An incremental pass over fewer updated rows checks each against the whole
+/// fleet. The grid is an O(N) build that saves O(N) checks per row, and it
+/// breaks even at about this many rows whatever the fleet size.
+const GRID_MIN_SCAN_ROWS: usize = 6;
 
 /// Severity levels for detected conflicts.
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
@@ -30,6 +40,43 @@ struct ClosestApproach {
     pos2: (f64, f64, f64),
 }
 
+/// Position and velocity of one drone relative to another in a local
+/// ENU frame (meters, m/s), centered on the midpoint of the pair.
+#[derive(Debug, Clone, Copy)]
+struct RelativeMotion {
+    pos_x: f64,
+    pos_y: f64,
+    pos_z: f64,
+    vel_x: f64,
+    vel_y: f64,
+    vel_z: f64,
+}
+
+impl RelativeMotion {
+    fn between(table: &DroneTable, i: usize, j: usize) -> Self {
+        // Both drones share the midpoint frame, so only the coordinate deltas
+        // matter; the cached cosines stand in for cos(midpoint latitude).
+        let lon_scale = meters_per_deg_lon((table.cos_lat[i] + table.cos_lat[j]) / 2.0);
+
+        Self {
+            pos_x: (table.lon[j] - table.lon[i]) * lon_scale,
+            pos_y: (table.lat[j] - table.lat[i]) * METERS_PER_DEG_LAT,
+            pos_z: table.alt[j] - table.alt[i],
+            vel_x: table.vel_x[j] - table.vel_x[i],
+            vel_y: table.vel_y[j] - table.vel_y[i],
+            vel_z: table.vel_z[j] - table.vel_z[i],
+        }
+    }
+
+    /// Separation distance after `t` seconds of straight-line motion.
+    fn distance_at(&self, t: f64) -> f64 {
+        let dx = self.pos_x + self.vel_x * t;
+        let dy = self.pos_y + self.vel_y * t;
+        let dz = self.pos_z + self.vel_z * t;
+        (dx * dx + dy * dy + dz * dz).sqrt()
+    }
+}
+
 /// Current position and velocity of a drone.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DronePosition {
@@ -96,6 +143,169 @@ pub struct Conflict {
     pub timestamp: f64,
 }
 
+/// Tracked drones stored as parallel columns, one row per drone.
+///
+/// Hot fields (plus `cos(lat)`) live in contiguous `f64` columns that the pair
+/// loop reads directly; full positions are kept alongside for ids and
+/// `get_all_positions`.
+/// Removal swaps the last row into the hole, so row indices are not stable.
+#[derive(Default)]
+struct DroneTable {
+    /// Row index by drone ID
+    rows: HashMap<String, usize>,
+    positions: Vec<DronePosition>,
+    lat: Vec<f64>,
+    lon: Vec<f64>,
+    alt: Vec<f64>,
+    speed: Vec<f64>,
+    cos_lat: Vec<f64>,
+    /// East/north velocity (m/s), derived from heading and speed on update
+    vel_x: Vec<f64>,
+    vel_y: Vec<f64>,
+    /// Vertical rate (m/s)
+    vel_z: Vec<f64>,
+}
+
+impl DroneTable {
+    fn upsert(&mut self, position: DronePosition) {
+        let cos_lat = position.lat.to_radians().cos();
+        let (vel_x, vel_y) = velocity_xy(&position);
+        if let Some(&row) = self.rows.get(&position.drone_id) {
+            self.lat[row] = position.lat;
+            self.lon[row] = position.lon;
+            self.alt[row] = position.altitude_m;
+            self.speed[row] = position.speed_mps;
+            self.cos_lat[row] = cos_lat;
+            self.vel_x[row] = vel_x;
+            self.vel_y[row] = vel_y;
+            self.vel_z[row] = position.velocity_z;
+            self.positions[row] = position;
+            return;
+        }
+
+        self.rows
+            .insert(position.drone_id.clone(), self.positions.len());
+        self.lat.push(position.lat);
+        self.lon.push(position.lon);
+        self.alt.push(position.altitude_m);
+        self.speed.push(position.speed_mps);
+        self.cos_lat.push(cos_lat);
+        self.vel_x.push(vel_x);
+        self.vel_y.push(vel_y);
+        self.vel_z.push(position.velocity_z);
+        self.positions.push(position);
+    }
+
+    fn remove(&mut self, drone_id: &str) {
+        let Some(row) = self.rows.remove(drone_id) else {
+            return;
+        };
+        self.positions.swap_remove(row);
+        self.lat.swap_remove(row);
+        self.lon.swap_remove(row);
+        self.alt.swap_remove(row);
+        self.speed.swap_remove(row);
+        self.cos_lat.swap_remove(row);
+        self.vel_x.swap_remove(row);
+        self.vel_y.swap_remove(row);
+        self.vel_z.swap_remove(row);
+        if let Some(moved) = self.positions.get(row) {
+            self.rows.insert(moved.drone_id.clone(), row);
+        }
+    }
+
+    fn len(&self) -> usize {
+        self.positions.len()
+    }
+
+    fn average_lat_lon(&self) -> (f64, f64) {
+        let count = self.len() as f64;
+        let sum_lat: f64 = self.lat.iter().sum();
+        let sum_lon: f64 = self.lon.iter().sum();
+        (sum_lat / count, sum_lon / count)
+    }
+}
+
+/// Spatial grid and thresholds shared by every row of one detection pass.
+struct PairScan<'a> {
+    table: &'a DroneTable,
+    /// Spatial index, or `None` when the fleet is small enough to check all pairs
+    grid: Option<PairGrid>,
+    max_speed: f64,
+    max_threshold: f64,
+    max_vertical_threshold: f64,
+    warning_h: f64,
+    warning_v: f64,
+    /// Timestamp stamped on every conflict found in this pass
+    now: f64,
+}
+
+struct PairGrid {
+    /// Table rows bucketed by grid cell
+    cells: HashMap<(i32, i32), Vec<usize>>,
+    /// Local ENU (x, y) of each table row
+    projected: Vec<(f64, f64)>,
+    cell_size_m: f64,
+}
+
+impl<'a> PairScan<'a> {
+    /// `scan_rows` is how many rows the pass will look up neighbors for.
+    fn new(detector: &ConflictDetector, table: &'a DroneTable, scan_rows: usize) -> Self {
+        let max_speed = table.speed.iter().copied().fold(0.0, f64::max);
+        let warning_h = detector.separation_horizontal_m * detector.warning_multiplier;
+        let warning_v = detector.separation_vertical_m * detector.warning_multiplier;
+        let max_threshold = detector.separation_horizontal_m.max(warning_h);
+        let max_vertical_threshold = detector.separation_vertical_m.max(warning_v);
+
+        let grid = (table.len() >= GRID_MIN_DRONES && scan_rows >= GRID_MIN_SCAN_ROWS).then(|| {
+            let cell_size_m = (max_threshold + max_speed * detector.lookahead_seconds).max(1.0);
+            PairGrid::new(table, cell_size_m)
+        });
+
+        Self {
+            table,
+            grid,
+            max_speed,
+            max_threshold,
+            max_vertical_threshold,
+            warning_h,
+            warning_v,
+            now: current_timestamp(),
+        }
+    }
+}
+
+impl PairGrid {
+    fn new(table: &DroneTable, cell_size_m: f64) -> Self {
+        let (ref_lat, ref_lon) = table.average_lat_lon();
+        let lon_scale = meters_per_deg_lon(ref_lat.to_radians().cos());
+        let mut cells: HashMap<(i32, i32), Vec<usize>> = HashMap::new();
+        let mut projected: Vec<(f64, f64)> = Vec::with_capacity(table.len());
+
+        for idx in 0..table.len() {
+            let (x, y) = project_xy(table.lat[idx], table.lon[idx], ref_lat, ref_lon, lon_scale);
+            projected.push((x, y));
+            cells
+                .entry(Self::cell_of(x, y, cell_size_m))
+                .or_default()
+                .push(idx);
+        }
+
+        Self {
+            cells,
+            projected,
+            cell_size_m,
+        }
+    }
+
+    fn cell_of(x: f64, y: f64, cell_size_m: f64) -> (i32, i32) {
+        (
+            (x / cell_size_m).floor() as i32,
+            (y / cell_size_m).floor() as i32,
+        )
+    }
+}
+
 /// Real-time conflict detection engine.
 ///
 /// Uses position extrapolation to predict conflicts within a
@@ -111,9 +321,11 @@ pub struct ConflictDetector {
     pub warning_multiplier: f64,
 
     /// Tracked drone positions
-    drones: HashMap<String, DronePosition>,
+    drones: DroneTable,
     /// Active conflicts (keyed by sorted drone ID pair)
     active_conflicts: HashMap<(String, String), Conflict>,
+    /// Drones updated since the last detection pass
+    dirty: HashSet<String>,
 }
 
 impl Default for ConflictDetector {
@@ -141,19 +353,24 @@ impl ConflictDetector {
             separation_horizontal_m,
             separation_vertical_m,
             warning_multiplier,
-            drones: HashMap::new(),
+            drones: DroneTable::default(),
             active_conflicts: HashMap::new(),
+            dirty: HashSet::new(),
         }
     }
 
     /// Update tracked position for a drone.
     pub fn update_position(&mut self, position: DronePosition) {
-        self.drones.insert(position.drone_id.clone(), position);
+        if !self.dirty.contains(&position.drone_id) {
+            self.dirty.insert(position.drone_id.clone());
+        }
+        self.drones.upsert(position);
     }
 
     /// Remove a drone from tracking.
     pub fn remove_drone(&mut self, drone_id: &str) {
         self.drones.remove(drone_id);
+        self.dirty.remove(drone_id);
         // Remove any conflicts involving this drone
         self.active_conflicts
             .retain(|(id1, id2), _| id1 != drone_id && id2 != drone_id);
@@ -161,7 +378,7 @@ impl ConflictDetector {
 
     /// Get all tracked drone positions.
     pub fn get_all_positions(&self) -> Vec<&DronePosition> {
-        self.drones.values().collect()
+        self.drones.positions.iter().collect()
     }
 
     /// Get number of tracked drones.
@@ -171,41 +388,43 @@ impl ConflictDetector {
 
     // Removed duplicate haversine_distance. Using crate::spatial::haversine_distance instead.
 
-    /// Predict drone position after time_offset_s seconds.
-    fn predict_position(drone: &DronePosition, time_offset_s: f64) -> (f64, f64, f64) {
-        if drone.speed_mps <= 0.0 {
-            let altitude_m = drone.altitude_m + drone.velocity_z * time_offset_s;
-            return (drone.lat, drone.lon, altitude_m);
-        }
-
-        // Distance traveled
-        let distance_m = drone.speed_mps * time_offset_s;
-
-        // Convert heading to radians (0 = North, clockwise)
-        let heading_rad = drone.heading_deg.to_radians();
-
-        let (lat, lon) =
-            crate::spatial::offset_by_bearing(drone.lat, drone.lon, distance_m, heading_rad);
+    /// Predict the position of a table row after time_offset_s seconds.
+    ///
+    /// Straight-line extrapolation from the cached velocity; over the lookahead
+    /// window this matches a great-circle offset to well under a meter.
+    fn predict_position(table: &DroneTable, row: usize, time_offset_s: f64) -> (f64, f64, f64) {
+        let altitude_m = table.alt[row] + table.vel_z[row] * time_offset_s;
+        let north_m = table.vel_y[row] * time_offset_s;
+        let east_m = table.vel_x[row] * time_offset_s;
 
-        let altitude_m = drone.altitude_m + drone.velocity_z * time_offset_s;
+        let lat = table.lat[row] + (north_m / EARTH_RADIUS_M).to_degrees();
+        let lon = table.lon[row]
+            + (east_m / (EARTH_RADIUS_M * table.cos_lat[row].abs().max(0.01))).to_degrees();
 
         (lat, lon, altitude_m)
     }
 
-    /// Check separation between two positions.
-    /// Returns (horizontal_distance_m, vertical_distance_m).
-    fn check_separation(pos1: (f64, f64, f64), pos2: (f64, f64, f64)) -> (f64, f64) {
-        let horizontal = crate::spatial::haversine_distance(pos1.0, pos1.1, pos2.0, pos2.1);
-        let vertical = (pos1.2 - pos2.2).abs();
-        (horizontal, vertical)
+    /// Horizontal separation between two table rows in meters.
+    ///
+    /// Uses the flat-earth approximation: pairs that matter are at most a few
+    /// kilometers apart, where it is indistinguishable from haversine.
+    fn horizontal_separation(table: &DroneTable, i: usize, j: usize) -> f64 {
+        crate::spatial::equirectangular_distance(
+            table.lat[i],
+            table.lon[i],
+            table.lat[j],
+            table.lon[j],
+            (table.cos_lat[i] + table.cos_lat[j]) / 2.0,
+        )
     }
 
     /// Find time and distance of closest approach.
     /// Returns (severity, time_to_closest_s, closest_distance_m, cpa_lat, cpa_lon, cpa_altitude_m).
     fn predict_conflict(
         &self,
-        drone1: &DronePosition,
-        drone2: &DronePosition,
+        table: &DroneTable,
+        i: usize,
+        j: usize,
         warning_horizontal_m: f64,
         warning_vertical_m: f64,
     ) -> Option<(ConflictSeverity, f64, f64, f64, f64, f64)> {
@@ -214,52 +433,24 @@ impl ConflictDetector {
             return None;
         }
 
-        let ref_lat = (drone1.lat + drone2.lat) / 2.0;
-        let ref_lon = (drone1.lon + drone2.lon) / 2.0;
-
-        let (d1_x, d1_y) = project_xy(drone1.lat, drone1.lon, ref_lat, ref_lon);
-        let (d2_x, d2_y) = project_xy(drone2.lat, drone2.lon, ref_lat, ref_lon);
-
-        let (v1_x, v1_y) = velocity_xy(drone1);
-        let (v2_x, v2_y) = velocity_xy(drone2);
-
-        let rel_pos_x = d2_x - d1_x;
-        let rel_pos_y = d2_y - d1_y;
-        let rel_pos_z = drone2.altitude_m - drone1.altitude_m;
-
-        let rel_vel_x = v2_x - v1_x;
-        let rel_vel_y = v2_y - v1_y;
-        let rel_vel_z = drone2.velocity_z - drone1.velocity_z;
+        let motion = RelativeMotion::between(table, i, j);
 
         let best = if let Some(window) = conflict_time_window(
-            rel_pos_x,
-            rel_pos_y,
-            rel_vel_x,
-            rel_vel_y,
-            rel_pos_z,
-            rel_vel_z,
+            &motion,
             self.separation_horizontal_m,
             self.separation_vertical_m,
             lookahead,
         ) {
             (
                 ConflictSeverity::Critical,
-                best_approach_in_window(drone1, drone2, window),
+                best_approach_in_window(table, i, j, &motion, window),
             )
-        } else if let Some(window) = conflict_time_window(
-            rel_pos_x,
-            rel_pos_y,
-            rel_vel_x,
-            rel_vel_y,
-            rel_pos_z,
-            rel_vel_z,
-            warning_horizontal_m,
-            warning_vertical_m,
-            lookahead,
-        ) {
+        } else if let Some(window) =
+            conflict_time_window(&motion, warning_horizontal_m, warning_vertical_m, lookahead)
+        {
             (
                 ConflictSeverity::Warning,
-                best_approach_in_window(drone1, drone2, window),
+                best_approach_in_window(table, i, j, &motion, window),
             )
         } else {
             return None;
@@ -281,149 +472,231 @@ impl ConflictDetector {
         ))
     }
 
-    /// Check all tracked drones for conflicts.
-    pub fn detect_conflicts(&mut self) -> Vec<Conflict> {
+    /// Check the given table rows against their grid neighbors.
+    fn scan_rows(&self, scan: &PairScan<'_>, rows: impl Iterator<Item = usize>) -> Vec<Conflict> {
         let mut conflicts = Vec::new();
-        let drone_list: Vec<DronePosition> = self.drones.values().cloned().collect();
-        if drone_list.len() < 2 {
-            self.active_conflicts.clear();
-            return conflicts;
+        for i in rows {
+            self.for_each_candidate(scan, i, |j| {
+                if j > i {
+                    conflicts.extend(self.check_pair(scan, i, j));
+                }
+            });
         }
+        conflicts
+    }
 
-        let max_speed = drone_list
-            .iter()
-            .map(|drone| drone.speed_mps)
-            .fold(0.0, f64::max);
-        let warning_h = self.separation_horizontal_m * self.warning_multiplier;
-        let warning_v = self.separation_vertical_m * self.warning_multiplier;
-        let max_threshold = self.separation_horizontal_m.max(warning_h);
-        let cell_size_m = (max_threshold + max_speed * self.lookahead_seconds).max(1.0);
-
-        let (ref_lat, ref_lon) = average_lat_lon(&drone_list);
-        let mut grid: HashMap<(i32, i32), Vec<usize>> = HashMap::new();
-        let mut projected: Vec<(f64, f64)> = Vec::with_capacity(drone_list.len());
-
-        for (idx, drone) in drone_list.iter().enumerate() {
-            let (x, y) = project_xy(drone.lat, drone.lon, ref_lat, ref_lon);
-            projected.push((x, y));
-            let cell = (
-                (x / cell_size_m).floor() as i32,
-                (y / cell_size_m).floor() as i32,
-            );
-            grid.entry(cell).or_default().push(idx);
-        }
+    /// Visit every row that could pair with row `i`: its grid neighborhood,
+    /// or the whole table when the pass has no grid. Includes `i` itself.
+    fn for_each_candidate(&self, scan: &PairScan<'_>, i: usize, mut visit: impl FnMut(usize)) {
+        let Some(grid) = &scan.grid else {
+            (0..scan.table.len()).for_each(visit);
+            return;
+        };
 
         // Check nearby pairs using a spatial grid to avoid O(N^2) scans.
-        for i in 0..drone_list.len() {
-            let drone1 = &drone_list[i];
-            let (x, y) = projected[i];
-            let cell_x = (x / cell_size_m).floor() as i32;
-            let cell_y = (y / cell_size_m).floor() as i32;
-            let search_radius_m =
-                max_threshold + (drone1.speed_mps + max_speed) * self.lookahead_seconds;
-            let search_cells = (search_radius_m / cell_size_m).ceil() as i32;
-
-            for dx in -search_cells..=search_cells {
-                for dy in -search_cells..=search_cells {
-                    let Some(indices) = grid.get(&(cell_x + dx, cell_y + dy)) else {
-                        continue;
-                    };
-
-                    for &j in indices {
-                        if j <= i {
-                            continue;
-                        }
-                        let drone2 = &drone_list[j];
-
-                        // Check current separation
-                        let (h_dist, v_dist) = Self::check_separation(
-                            (drone1.lat, drone1.lon, drone1.altitude_m),
-                            (drone2.lat, drone2.lon, drone2.altitude_m),
-                        );
-                        let max_possible_distance = max_threshold
-                            + (drone1.speed_mps + drone2.speed_mps) * self.lookahead_seconds;
-                        if h_dist > max_possible_distance {
-                            continue;
-                        }
-                        let current_distance = (h_dist.powi(2) + v_dist.powi(2)).sqrt();
-
-                        // Check for current violation
-                        if h_dist < self.separation_horizontal_m
-                            && v_dist < self.separation_vertical_m
-                        {
-                            // Current position is the CPA for immediate violations
-                            let cpa_lat = (drone1.lat + drone2.lat) / 2.0;
-                            let cpa_lon = (drone1.lon + drone2.lon) / 2.0;
-                            let cpa_altitude_m = (drone1.altitude_m + drone2.altitude_m) / 2.0;
-                            let (drone1_id, drone2_id) = if drone1.drone_id <= drone2.drone_id {
-                                (drone1.drone_id.clone(), drone2.drone_id.clone())
-                            } else {
-                                (drone2.drone_id.clone(), drone1.drone_id.clone())
-                            };
-
-                            conflicts.push(Conflict {
-                                drone1_id,
-                                drone2_id,
-                                severity: ConflictSeverity::Critical,
-                                distance_m: current_distance,
-                                time_to_closest: 0.0,
-                                closest_distance_m: current_distance,
-                                cpa_lat,
-                                cpa_lon,
-                                cpa_altitude_m,
-                                timestamp: current_timestamp(),
-                            });
-                            continue;
-                        }
-
-                        let Some((
-                            severity,
-                            time_to_closest,
-                            closest_distance,
-                            cpa_lat,
-                            cpa_lon,
-                            cpa_altitude_m,
-                        )) = self.predict_conflict(drone1, drone2, warning_h, warning_v)
-                        else {
-                            continue;
-                        };
-
-                        let (drone1_id, drone2_id) = if drone1.drone_id <= drone2.drone_id {
-                            (drone1.drone_id.clone(), drone2.drone_id.clone())
-                        } else {
-                            (drone2.drone_id.clone(), drone1.drone_id.clone())
-                        };
-
-                        conflicts.push(Conflict {
-                            drone1_id,
-                            drone2_id,
-                            severity,
-                            distance_m: current_distance,
-                            time_to_closest,
-                            closest_distance_m: closest_distance,
-                            cpa_lat,
-                            cpa_lon,
-                            cpa_altitude_m,
-                            timestamp: current_timestamp(),
-                        });
-                    }
+        let (x, y) = grid.projected[i];
+        let (cell_x, cell_y) = PairGrid::cell_of(x, y, grid.cell_size_m);
+        let search_radius_m =
+            scan.max_threshold + (scan.table.speed[i] + scan.max_speed) * self.lookahead_seconds;
+        let search_cells = (search_radius_m / grid.cell_size_m).ceil() as i32;
+
+        for dx in -search_cells..=search_cells {
+            for dy in -search_cells..=search_cells {
+                if let Some(indices) = grid.cells.get(&(cell_x + dx, cell_y + dy)) {
+                    indices.iter().copied().for_each(&mut visit);
                 }
             }
         }
+    }
+
+    /// Evaluate a single pair of table rows.
+    fn check_pair(&self, scan: &PairScan<'_>, i: usize, j: usize) -> Option<Conflict> {
+        let table = scan.table;
+        let drone1 = &table.positions[i];
+        let drone2 = &table.positions[j];
+
+        // Vertical gap first: if it cannot close to within the widest vertical
+        // threshold during the lookahead, skip the horizontal distance entirely.
+        let v_dist = (table.alt[i] - table.alt[j]).abs();
+        let closing_m = (table.vel_z[i] - table.vel_z[j]).abs() * self.lookahead_seconds.max(0.0);
+        if v_dist - closing_m > scan.max_vertical_threshold {
+            return None;
+        }
+
+        // Check current separation
+        let h_dist = Self::horizontal_separation(table, i, j);
+        let max_possible_distance =
+            scan.max_threshold + (table.speed[i] + table.speed[j]) * self.lookahead_seconds;
+        if h_dist > max_possible_distance {
+            return None;
+        }
+        let current_distance = (h_dist.powi(2) + v_dist.powi(2)).sqrt();
+
+        let (drone1_id, drone2_id) = if drone1.drone_id <= drone2.drone_id {
+            (&drone1.drone_id, &drone2.drone_id)
+        } else {
+            (&drone2.drone_id, &drone1.drone_id)
+        };
+
+        // Check for current violation
+        if h_dist < self.separation_horizontal_m && v_dist < self.separation_vertical_m {
+            // Current position is the CPA for immediate violations
+            return Some(Conflict {
+                drone1_id: drone1_id.clone(),
+                drone2_id: drone2_id.clone(),
+                severity: ConflictSeverity::Critical,
+                distance_m: current_distance,
+                time_to_closest: 0.0,
+                closest_distance_m: current_distance,
+                cpa_lat: (table.lat[i] + table.lat[j]) / 2.0,
+                cpa_lon: (table.lon[i] + table.lon[j]) / 2.0,
+                cpa_altitude_m: (table.alt[i] + table.alt[j]) / 2.0,
+                timestamp: scan.now,
+            });
+        }
+
+        let (severity, time_to_closest, closest_distance, cpa_lat, cpa_lon, cpa_altitude_m) =
+            self.predict_conflict(table, i, j, scan.warning_h, scan.warning_v)?;
+
+        Some(Conflict {
+            drone1_id: drone1_id.clone(),
+            drone2_id: drone2_id.clone(),
+            severity,
+            distance_m: current_distance,
+            time_to_closest,
+            closest_distance_m: closest_distance,
+            cpa_lat,
+            cpa_lon,
+            cpa_altitude_m,
+            timestamp: scan.now,
+        })
+    }
+
+    /// Check all tracked drones for conflicts.
+    pub fn detect_conflicts(&mut self) -> Vec<Conflict> {
+        self.dirty.clear();
+        if self.drones.len() < 2 {
+            self.active_conflicts.clear();
+            return Vec::new();
+        }
+
+        let scan = PairScan::new(self, &self.drones, self.drones.len());
+        let row_count = scan.table.len();
+        // Row i only pairs with j > i, so contiguous chunks would leave the
+        // first worker with most of the work; strides balance it.
+        let conflicts = fan_out(worker_count(row_count), |offset, step| {
+            self.scan_rows(&scan, (offset..row_count).step_by(step))
+        });
 
         // Update active conflicts
         self.active_conflicts.clear();
+        self.active_conflicts.reserve(conflicts.len());
         for conflict in &conflicts {
-            let key = if conflict.drone1_id < conflict.drone2_id {
-                (conflict.drone1_id.clone(), conflict.drone2_id.clone())
-            } else {
-                (conflict.drone2_id.clone(), conflict.drone1_id.clone())
-            };
+            // check_pair emits each pair once with IDs already in sorted order.
+            let key = (conflict.drone1_id.clone(), conflict.drone2_id.clone());
             self.active_conflicts.insert(key, conflict.clone());
         }
 
         conflicts
     }
+
+    /// Re-check only pairs involving drones updated since the last pass.
+    ///
+    /// Pairs between two unchanged drones keep their previous result. A tick
+    /// that moves fewer than `GRID_MIN_SCAN_ROWS` drones checks each of them
+    /// against the whole fleet, O(N * updated) pair checks, instead of
+    /// building the spatial grid; larger updates build the grid as a full pass
+    /// would, which is itself O(N). If at least half the fleet changed it runs
+    /// a full pass instead, and enough rescanned pairs are spread over worker
+    /// threads like [`Self::detect_conflicts`]. Returns every active conflict,
+    /// not just the refreshed ones.
+    pub fn detect_conflicts_incremental(&mut self) -> Vec<Conflict> {
+        // When most drones moved (startup, or a burst of telemetry) the
+        // incremental bookkeeping buys nothing over a full pass.
+        if self.dirty.len() * 2 >= self.drones.len() {
+            return self.detect_conflicts();
+        }
+
+        let dirty = std::mem::take(&mut self.dirty);
+        if !dirty.is_empty() {
+            self.active_conflicts
+                .retain(|(id1, id2), _| !dirty.contains(id1) && !dirty.contains(id2));
+
+            let table = &self.drones;
+            let dirty_rows: Vec<usize> = dirty
+                .iter()
+                .filter_map(|id| table.rows.get(id).copied())
+                .collect();
+            let mut is_dirty = vec![false; table.len()];
+            for &row in &dirty_rows {
+                is_dirty[row] = true;
+            }
+
+            let scan = PairScan::new(self, table, dirty_rows.len());
+            // Size threads by the work, not the fleet: spread the rows only when
+            // they add up to at least what a full pass does at the threshold,
+            // and never start more workers than there are rows.
+            let workers = if dirty_rows.len() * table.len()
+                >= PARALLEL_MIN_DRONES * PARALLEL_MIN_DRONES / 2
+            {
+                worker_count(table.len()).min(dirty_rows.len())
+            } else {
+                1
+            };
+            let refreshed = fan_out(workers, |offset, step| {
+                let mut conflicts = Vec::new();
+                for &i in dirty_rows.iter().skip(offset).step_by(step) {
+                    self.for_each_candidate(&scan, i, |j| {
+                        // Pairs of two dirty drones are checked once, from the lower row.
+                        if j != i && !(is_dirty[j] && j < i) {
+                            conflicts.extend(self.check_pair(&scan, i, j));
+                        }
+                    });
+                }
+                conflicts
+            });
+
+            for conflict in refreshed {
+                let key = (conflict.drone1_id.clone(), conflict.drone2_id.clone());
+                self.active_conflicts.insert(key, conflict);
+            }
+        }
+
+        self.active_conflicts.values().cloned().collect()
+    }
+}
+
+/// Worker threads for a pass over `row_count` tracked drones.
+fn worker_count(row_count: usize) -> usize {
+    if row_count >= PARALLEL_MIN_DRONES {
+        std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+    } else {
+        1
+    }
+}
+
+/// Run `scan(offset, step)` for each of `workers` strided slices of the work
+/// and concatenate the results; a single worker runs on the calling thread.
+fn fan_out<F>(workers: usize, scan: F) -> Vec<Conflict>
+where
+    F: Fn(usize, usize) -> Vec<Conflict> + Sync,
+{
+    if workers <= 1 {
+        return scan(0, 1);
+    }
+
+    let scan = &scan;
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|offset| scope.spawn(move || scan(offset, workers)))
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().expect("conflict scan worker panicked"))
+            .collect()
+    })
 }
 
 fn velocity_xy(drone: &DronePosition) -> (f64, f64) {
@@ -439,26 +712,21 @@ fn velocity_xy(drone: &DronePosition) -> (f64, f64) {
 }
 
 fn conflict_time_window(
-    rel_pos_x: f64,
-    rel_pos_y: f64,
-    rel_vel_x: f64,
-    rel_vel_y: f64,
-    rel_pos_z: f64,
-    rel_vel_z: f64,
+    motion: &RelativeMotion,
     horiz_threshold_m: f64,
     vert_threshold_m: f64,
     lookahead_s: f64,
 ) -> Option<(f64, f64)> {
     let (h_start, h_end) = horizontal_time_window(
-        rel_pos_x,
-        rel_pos_y,
-        rel_vel_x,
-        rel_vel_y,
+        motion.pos_x,
+        motion.pos_y,
+        motion.vel_x,
+        motion.vel_y,
         horiz_threshold_m,
         lookahead_s,
     )?;
     let (v_start, v_end) =
-        vertical_time_window(rel_pos_z, rel_vel_z, vert_threshold_m, lookahead_s)?;
+        vertical_time_window(motion.pos_z, motion.vel_z, vert_threshold_m, lookahead_s)?;
 
     let start = h_start.max(v_start);
     let end = h_end.min(v_end);
@@ -537,81 +805,54 @@ fn vertical_time_window(
 }
 
 fn best_approach_in_window(
-    drone1: &DronePosition,
-    drone2: &DronePosition,
+    table: &DroneTable,
+    i: usize,
+    j: usize,
+    motion: &RelativeMotion,
     window_s: (f64, f64),
 ) -> ClosestApproach {
     let (start_s, end_s) = window_s;
     let start_s = start_s.max(0.0);
     let end_s = end_s.max(start_s);
 
-    let ref_lat = (drone1.lat + drone2.lat) / 2.0;
-    let ref_lon = (drone1.lon + drone2.lon) / 2.0;
-
-    let (d1_x, d1_y) = project_xy(drone1.lat, drone1.lon, ref_lat, ref_lon);
-    let (d2_x, d2_y) = project_xy(drone2.lat, drone2.lon, ref_lat, ref_lon);
-
-    let (v1_x, v1_y) = velocity_xy(drone1);
-    let (v2_x, v2_y) = velocity_xy(drone2);
-
-    let rel_pos_x = d2_x - d1_x;
-    let rel_pos_y = d2_y - d1_y;
-    let rel_pos_z = drone2.altitude_m - drone1.altitude_m;
-
-    let rel_vel_x = v2_x - v1_x;
-    let rel_vel_y = v2_y - v1_y;
-    let rel_vel_z = drone2.velocity_z - drone1.velocity_z;
-
-    let rel_speed_sq = rel_vel_x * rel_vel_x + rel_vel_y * rel_vel_y + rel_vel_z * rel_vel_z;
+    let rel_speed_sq =
+        motion.vel_x * motion.vel_x + motion.vel_y * motion.vel_y + motion.vel_z * motion.vel_z;
     let t_star = if rel_speed_sq.abs() <= CPA_EPS {
         start_s
     } else {
-        let dot = rel_pos_x * rel_vel_x + rel_pos_y * rel_vel_y + rel_pos_z * rel_vel_z;
+        let dot =
+            motion.pos_x * motion.vel_x + motion.pos_y * motion.vel_y + motion.pos_z * motion.vel_z;
         (-dot / rel_speed_sq).clamp(start_s, end_s)
     };
 
-    let candidates = [start_s, t_star, end_s];
-    let mut best: Option<ClosestApproach> = None;
-
-    for &t in &candidates {
-        let distance_m = {
-            let dx = rel_pos_x + rel_vel_x * t;
-            let dy = rel_pos_y + rel_vel_y * t;
-            let dz = rel_pos_z + rel_vel_z * t;
-            (dx * dx + dy * dy + dz * dz).sqrt()
-        };
+    // Distance along the window is convex, so pick the best candidate in the
+    // local frame and only extrapolate geodetic positions for the winner.
+    let (time_s, distance_m) = [start_s, t_star, end_s]
+        .into_iter()
+        .map(|t| (t, motion.distance_at(t)))
+        .fold((start_s, f64::INFINITY), |best, candidate| {
+            if candidate.1 < best.1 {
+                candidate
+            } else {
+                best
+            }
+        });
 
-        let pos1 = ConflictDetector::predict_position(drone1, t);
-        let pos2 = ConflictDetector::predict_position(drone2, t);
-
-        let replace = best
-            .as_ref()
-            .map(|current| distance_m < current.distance_m)
-            .unwrap_or(true);
-        if replace {
-            best = Some(ClosestApproach {
-                distance_m,
-                time_s: t,
-                pos1,
-                pos2,
-            });
-        }
+    ClosestApproach {
+        distance_m,
+        time_s,
+        pos1: ConflictDetector::predict_position(table, i, time_s),
+        pos2: ConflictDetector::predict_position(table, j, time_s),
     }
-
-    best.expect("candidates always yields a best")
 }
 
-fn average_lat_lon(drones: &[DronePosition]) -> (f64, f64) {
-    let count = drones.len() as f64;
-    let (sum_lat, sum_lon) = drones.iter().fold((0.0, 0.0), |acc, drone| {
-        (acc.0 + drone.lat, acc.1 + drone.lon)
-    });
-    (sum_lat / count, sum_lon / count)
+/// Local meters per degree of longitude for a latitude with the given cosine.
+fn meters_per_deg_lon(cos_lat: f64) -> f64 {
+    cos_lat.abs().max(0.01) * METERS_PER_DEG_LAT
 }
 
-fn project_xy(lat: f64, lon: f64, ref_lat: f64, ref_lon: f64) -> (f64, f64) {
-    let meters_per_deg_lon = (ref_lat.to_radians().cos().abs().max(0.01)) * METERS_PER_DEG_LAT;
-    let x = (lon - ref_lon) * meters_per_deg_lon;
+fn project_xy(lat: f64, lon: f64, ref_lat: f64, ref_lon: f64, lon_scale: f64) -> (f64, f64) {
+    let x = (lon - ref_lon) * lon_scale;
     let y = (lat - ref_lat) * METERS_PER_DEG_LAT;
     (x, y)
 }
@@ -652,6 +893,175 @@ mod tests {
         assert_eq!(conflicts[0].severity, ConflictSeverity::Critical);
     }
 
+    #[test]
+    fn test_checks_every_nearby_pair() {
+        let mut detector = ConflictDetector::default();
+
+        // Three drones stacked within critical separation of each other.
+        detector.update_position(DronePosition::new("DRONE001", 33.6846, -117.8265, 50.0));
+        detector.update_position(DronePosition::new("DRONE002", 33.6846, -117.8265, 60.0));
+        detector.update_position(DronePosition::new("DRONE003", 33.6847, -117.8265, 55.0));
+        detector.update_position(DronePosition::new("DRONE004", 34.0, -118.0, 50.0));
+
+        let mut pairs: Vec<(String, String)> = detector
+            .detect_conflicts()
+            .into_iter()
+            .map(|c| (c.drone1_id, c.drone2_id))
+            .collect();
+        pairs.sort();
+        assert_eq!(
+            pairs,
+            vec![
+                ("DRONE001".to_string(), "DRONE002".to_string()),
+                ("DRONE001".to_string(), "DRONE003".to_string()),
+                ("DRONE002".to_string(), "DRONE003".to_string()),
+            ]
+        );
+    }
+
+    /// Co-located pairs `A{k}`/`B{k}` spaced 5 km apart, enough drones to use
+    /// worker threads. Returns the number of pairs.
+    fn add_stacked_pairs(detector: &mut ConflictDetector) -> usize {
+        let pair_count = PARALLEL_MIN_DRONES / 2 + 8;
+        for k in 0..pair_count {
+            let lat = 33.0 + crate::spatial::meters_to_lat(5_000.0 * (k / 20) as f64, 33.0);
+            let lon = -117.0 + crate::spatial::meters_to_lon(5_000.0 * (k % 20) as f64, 33.0);
+            detector.update_position(DronePosition::new(format!("A{k:04}"), lat, lon, 50.0));
+            detector.update_position(DronePosition::new(format!("B{k:04}"), lat, lon, 60.0));
+        }
+        pair_count
+    }
+
+    /// Lift `B{k}` for each k in `pairs` clear of its partner.
+    fn separate_pairs(detector: &mut ConflictDetector, pairs: std::ops::Range<usize>) {
+        for k in pairs {
+            let row = detector.drones.rows[&format!("B{k:04}")];
+            let position = detector.drones.positions[row].clone();
+            detector.update_position(DronePosition {
+                altitude_m: 500.0,
+                ..position
+            });
+        }
+    }
+
+    #[test]
+    fn test_parallel_scan_finds_every_pair() {
+        let mut detector = ConflictDetector::default();
+        let pair_count = add_stacked_pairs(&mut detector);
+
+        let conflicts = detector.detect_conflicts();
+        assert_eq!(conflicts.len(), pair_count);
+        assert!(conflicts
+            .iter()
+            .all(|c| c.drone1_id[1..] == c.drone2_id[1..]
+                && c.severity == ConflictSeverity::Critical));
+    }
+
+    #[test]
+    fn test_incremental_detection_on_large_fleet() {
+        let mut detector = ConflictDetector::default();
+        let pair_count = add_stacked_pairs(&mut detector);
+
+        // Every drone is new, so this runs as a full pass.
+        assert_eq!(detector.detect_conflicts_incremental().len(), pair_count);
+
+        // A few updated rows: checked against the whole fleet, no grid.
+        separate_pairs(&mut detector, 0..3);
+        assert!(detector.dirty.len() < GRID_MIN_SCAN_ROWS);
+        assert_eq!(
+            detector.detect_conflicts_incremental().len(),
+            pair_count - 3
+        );
+
+        // Just under half the fleet: grid plus worker threads.
+        let lifted = detector.drone_count() / 2 - 12;
+        separate_pairs(&mut detector, 3..3 + lifted);
+        assert!(detector.dirty.len() * 2 < detector.drone_count());
+        assert!(
+            detector.dirty.len() * detector.drone_count()
+                >= PARALLEL_MIN_DRONES * PARALLEL_MIN_DRONES / 2
+        );
+
+        let conflicts = detector.detect_conflicts_incremental();
+        assert_eq!(conflicts.len(), pair_count - 3 - lifted);
+        assert_eq!(detector.detect_conflicts().len(), pair_count - 3 - lifted);
+    }
+
+    #[test]
+    fn test_remove_drone_keeps_rows_consistent() {
+        let mut detector = ConflictDetector::default();
+
+        detector.update_position(DronePosition::new("DRONE001", 33.6846, -117.8265, 50.0));
+        detector.update_position(DronePosition::new("DRONE002", 34.0, -118.0, 50.0));
+        detector.update_position(DronePosition::new("DRONE003", 33.6846, -117.8265, 55.0));
+
+        // Removing a middle row moves the last drone into its slot.
+        detector.remove_drone("DRONE001");
+        detector.update_position(DronePosition::new("DRONE003", 34.0, -118.0, 55.0));
+        assert_eq!(detector.drone_count(), 2);
+
+        let conflicts = detector.detect_conflicts();
+        assert_eq!(conflicts.len(), 1);
+        assert_eq!(conflicts[0].drone1_id, "DRONE002");
+        assert_eq!(conflicts[0].drone2_id, "DRONE003");
+    }
+
+    #[test]
+    fn test_linear_prediction_matches_great_circle_offset() {
+        let mut table = DroneTable::default();
+        table.upsert(
+            DronePosition::new("DRONE001", 33.6846, -117.8265, 50.0).with_velocity(37.0, 25.0, 1.5),
+        );
+
+        let (lat, lon, alt) = ConflictDetector::predict_position(&table, 0, 20.0);
+        let (exp_lat, exp_lon) =
+            crate::spatial::offset_by_bearing(33.6846, -117.8265, 500.0, 37.0_f64.to_radians());
+        assert!(crate::spatial::haversine_distance(lat, lon, exp_lat, exp_lon) < 0.5);
+        assert!((alt - 80.0).abs() < 1e-9);
+    }
+
+    #[test]
+    fn test_incremental_detection_tracks_moved_drones() {
+        let mut detector = ConflictDetector::default();
+
+        detector.update_position(DronePosition::new("DRONE001", 33.6846, -117.8265, 50.0));
+        detector.update_position(DronePosition::new("DRONE002", 33.6846, -117.8265, 55.0));
+        detector.update_position(DronePosition::new("DRONE003", 34.0, -118.0, 50.0));
+        // Parked far away so a two-drone update stays on the incremental path.
+        detector.update_position(DronePosition::new("DRONE004", 36.0, -120.0, 50.0));
+        detector.update_position(DronePosition::new("DRONE005", 37.0, -121.0, 50.0));
+        assert_eq!(detector.detect_conflicts_incremental().len(), 1);
+
+        // Move DRONE002 away and DRONE003 next to DRONE001.
+        detector.update_position(DronePosition::new("DRONE002", 35.0, -119.0, 55.0));
+        detector.update_position(DronePosition::new("DRONE003", 33.6846, -117.8265, 60.0));
+        assert!(detector.dirty.len() * 2 < detector.drone_count());
+
+        let conflicts = detector.detect_conflicts_incremental();
+        assert_eq!(conflicts.len(), 1);
+        assert_eq!(conflicts[0].drone1_id, "DRONE001");
+        assert_eq!(conflicts[0].drone2_id, "DRONE003");
+
+        // Nothing changed since the last pass: the cached result is returned.
+        assert_eq!(detector.detect_conflicts_incremental().len(), 1);
+        assert_eq!(detector.detect_conflicts().len(), 1);
+    }
+
+    #[test]
+    fn test_stacked_drones_without_climb_do_not_conflict() {
+        let mut detector = ConflictDetector::default();
+
+        detector.update_position(DronePosition::new("DRONE001", 33.6846, -117.8265, 50.0));
+        detector.update_position(DronePosition::new("DRONE002", 33.6846, -117.8265, 150.0));
+        assert!(detector.detect_conflicts().is_empty());
+
+        // Descending at 3 m/s closes the 100m gap to within the warning band.
+        detector.update_position(
+            DronePosition::new("DRONE002", 33.6846, -117.8265, 150.0).with_velocity(0.0, 0.0, -3.0),
+        );
+        assert_eq!(detector.detect_conflicts().len(), 1);
+    }
+
     #[test]
     fn test_vertical_conflict_detection() {
         let mut detector = ConflictDetector::default();
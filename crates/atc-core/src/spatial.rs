@@ -177,10 +177,16 @@ fn check_timed_conflict(
         let pos2 = interpolate_position(path2, t, &mut idx2);
 
         if let (Some(p1), Some(p2)) = (pos1, pos2) {
-            let dist = haversine_distance(p1.lat, p1.lon, p2.lat, p2.lon);
+            // Altitude is a subtraction; only samples inside the vertical band
+            // pay for a horizontal distance. Samples that matter are within
+            // min_sep_m, where the flat-earth form is exact to well under a mm.
             let alt_diff = (p1.altitude_m - p2.altitude_m).abs();
-            if dist < min_sep_m && alt_diff < min_vert_sep_m {
-                return true;
+            if alt_diff < min_vert_sep_m {
+                let cos_ref_lat = ((p1.lat + p2.lat) / 2.0).to_radians().cos();
+                let dist = equirectangular_distance(p1.lat, p1.lon, p2.lat, p2.lon, cos_ref_lat);
+                if dist < min_sep_m {
+                    return true;
+                }
             }
         }
 
@@ -353,13 +359,42 @@ pub(crate) fn segments_intersect_2d(
 /// Distance in meters
 pub const EARTH_RADIUS_M: f64 = 6_371_000.0;
 
+#[inline]
 pub fn haversine_distance(lat1: f64, lon1: f64, lat2: f64, lon2: f64) -> f64 {
     let phi1 = lat1.to_radians();
     let phi2 = lat2.to_radians();
     let dphi = (lat2 - lat1).to_radians();
     let dlambda = (lon2 - lon1).to_radians();
     let a = (dphi / 2.0).sin().powi(2) + phi1.cos() * phi2.cos() * (dlambda / 2.0).sin().powi(2);
-    2.0 * EARTH_RADIUS_M * a.sqrt().atan2((1.0 - a).sqrt())
+    // asin(sqrt(a)) equals atan2(sqrt(a), sqrt(1 - a)) with one fewer sqrt;
+    // clamp so rounding near antipodes cannot push asin out of its domain.
+    2.0 * EARTH_RADIUS_M * a.clamp(0.0, 1.0).sqrt().asin()
+}
+
+/// Equirectangular (flat-earth) distance in meters on the same sphere as
+/// [`haversine_distance`], with `cos(lat)` of the reference latitude supplied
+/// by the caller.
+///
+/// Within a few kilometers this agrees with haversine to well under a
+/// centimeter and needs no trig per call, which suits pairwise separation checks.
+#[inline]
+pub(crate) fn equirectangular_distance(
+    lat1: f64,
+    lon1: f64,
+    lat2: f64,
+    lon2: f64,
+    cos_ref_lat: f64,
+) -> f64 {
+    // Take the short way round when the points straddle the antimeridian.
+    let mut dlon = lon2 - lon1;
+    if dlon >= 180.0 {
+        dlon -= 360.0;
+    } else if dlon < -180.0 {
+        dlon += 360.0;
+    }
+    let dx = dlon.to_radians() * cos_ref_lat;
+    let dy = (lat2 - lat1).to_radians();
+    EARTH_RADIUS_M * dx.hypot(dy)
 }
 
 // ==== ENU (East-North-Up) Coordinate Conversion ====
@@ -442,29 +477,63 @@ pub fn bearing(lat1: f64, lon1: f64, lat2: f64, lon2: f64) -> f64 {
 /// # Returns
 /// (new_lat, new_lon) in degrees
 pub fn offset_by_bearing(lat: f64, lon: f64, distance_m: f64, bearing_rad: f64) -> (f64, f64) {
-    if distance_m.abs() <= f64::EPSILON {
-        return (lat, lon);
-    }
+    GreatCircleOrigin::new(lat, lon).offset(distance_m, bearing_rad)
+}
 
-    let lat1 = lat.to_radians();
-    let lon1 = lon.to_radians();
-    let angular_distance = distance_m / EARTH_RADIUS_M;
+/// Fixed start point for repeated great-circle offsets.
+///
+/// Holds the origin's latitude trig so callers that offset many times from one
+/// point (flight paths, rings of start positions) pay for it once.
+/// [`offset_by_bearing`] is the one-shot form.
+#[derive(Debug, Clone, Copy)]
+pub struct GreatCircleOrigin {
+    lat: f64,
+    lon: f64,
+    lon_rad: f64,
+    sin_lat: f64,
+    cos_lat: f64,
+}
 
-    let sin_lat1 = lat1.sin();
-    let cos_lat1 = lat1.cos();
-    let sin_ad = angular_distance.sin();
-    let cos_ad = angular_distance.cos();
+impl GreatCircleOrigin {
+    pub fn new(lat: f64, lon: f64) -> Self {
+        let lat_rad = lat.to_radians();
+        Self {
+            lat,
+            lon,
+            lon_rad: lon.to_radians(),
+            sin_lat: lat_rad.sin(),
+            cos_lat: lat_rad.cos(),
+        }
+    }
 
-    let sin_lat2 = sin_lat1 * cos_ad + cos_lat1 * sin_ad * bearing_rad.cos();
-    let lat2 = sin_lat2.clamp(-1.0, 1.0).asin();
+    /// Offset by distance (meters) and bearing (radians, 0 = north).
+    pub fn offset(&self, distance_m: f64, bearing_rad: f64) -> (f64, f64) {
+        if distance_m.abs() <= f64::EPSILON {
+            return (self.lat, self.lon);
+        }
 
-    let y = bearing_rad.sin() * sin_ad * cos_lat1;
-    let x = cos_ad - sin_lat1 * sin_lat2;
-    let mut lon2 = lon1 + y.atan2(x);
-    lon2 =
-        (lon2 + std::f64::consts::PI).rem_euclid(2.0 * std::f64::consts::PI) - std::f64::consts::PI;
+        let (sin_ad, cos_ad) = (distance_m / EARTH_RADIUS_M).sin_cos();
+        let (sin_b, cos_b) = bearing_rad.sin_cos();
+        self.offset_sin_cos(sin_ad, cos_ad, sin_b, cos_b)
+    }
 
-    (lat2.to_degrees(), lon2.to_degrees())
+    /// Offset given sin/cos of the angular distance and of the bearing.
+    ///
+    /// For callers that hold either of them fixed across calls. Does not
+    /// special-case a zero distance.
+    #[inline]
+    pub fn offset_sin_cos(&self, sin_ad: f64, cos_ad: f64, sin_b: f64, cos_b: f64) -> (f64, f64) {
+        let sin_lat2 = self.sin_lat * cos_ad + self.cos_lat * sin_ad * cos_b;
+        let lat2 = sin_lat2.clamp(-1.0, 1.0).asin();
+
+        let y = sin_b * sin_ad * self.cos_lat;
+        let x = cos_ad - self.sin_lat * sin_lat2;
+        let mut lon2 = self.lon_rad + y.atan2(x);
+        lon2 = (lon2 + std::f64::consts::PI).rem_euclid(2.0 * std::f64::consts::PI)
+            - std::f64::consts::PI;
+
+        (lat2.to_degrees(), lon2.to_degrees())
+    }
 }
 
 /// Calculate minimum distance from a point to a line segment (in meters).
@@ -531,12 +600,76 @@ mod tests {
         assert!((dist - 111_194.0).abs() < 100.0);
     }
 
+    #[test]
+    fn test_equirectangular_matches_haversine_at_short_range() {
+        let lat1 = 33.6846;
+        let lon1 = -117.8265;
+        let lat2 = lat1 + meters_to_lat(600.0, lat1);
+        let lon2 = lon1 + meters_to_lon(800.0, lat1);
+        let cos_ref = ((lat1 + lat2) / 2.0).to_radians().cos();
+
+        let flat = equirectangular_distance(lat1, lon1, lat2, lon2, cos_ref);
+        let exact = haversine_distance(lat1, lon1, lat2, lon2);
+        assert!((flat - exact).abs() < 0.01, "flat={flat} exact={exact}");
+    }
+
+    #[test]
+    fn test_equirectangular_wraps_across_antimeridian() {
+        let flat = equirectangular_distance(
+            10.0,
+            179.99999,
+            10.0,
+            -179.99999,
+            10.0_f64.to_radians().cos(),
+        );
+        let exact = haversine_distance(10.0, 179.99999, 10.0, -179.99999);
+        assert!(exact < 3.0);
+        assert!((flat - exact).abs() < 0.01, "flat={flat} exact={exact}");
+    }
+
+    #[test]
+    fn test_timed_conflict_across_antimeridian() {
+        let east = [TimedPoint {
+            time_s: 0.0,
+            lat: 10.0,
+            lon: 179.99999,
+            altitude_m: 100.0,
+        }];
+        let west = [TimedPoint {
+            time_s: 0.0,
+            lat: 10.0,
+            lon: -179.99999,
+            altitude_m: 100.0,
+        }];
+        assert!(check_timed_conflict(&east, &west, 50.0, 30.0));
+    }
+
+    #[test]
+    fn test_haversine_antipodal_points() {
+        let dist = haversine_distance(0.0, 0.0, 0.0, 180.0);
+        assert!((dist - std::f64::consts::PI * EARTH_RADIUS_M).abs() < 1.0);
+    }
+
     #[test]
     fn test_haversine_same_point() {
         let dist = haversine_distance(33.6846, -117.8265, 33.6846, -117.8265);
         assert!(dist < 0.001);
     }
 
+    #[test]
+    fn test_great_circle_origin_reuses_precomputed_trig() {
+        let origin = GreatCircleOrigin::new(33.6846, -117.8265);
+        assert_eq!(origin.offset(0.0, 1.0), (33.6846, -117.8265));
+
+        let (sin_ad, cos_ad) = (300.0 / EARTH_RADIUS_M).sin_cos();
+        for bearing_deg in [0.0_f64, 45.0, 90.0, 200.0, 315.0] {
+            let (sin_b, cos_b) = bearing_deg.to_radians().sin_cos();
+            let (lat, lon) = origin.offset_sin_cos(sin_ad, cos_ad, sin_b, cos_b);
+            let dist = haversine_distance(33.6846, -117.8265, lat, lon);
+            assert!((dist - 300.0).abs() < 1e-6);
+        }
+    }
+
     #[test]
     fn segment_to_segment_distance_detects_crossing_segments() {
         // Two segments that cross like an "X" should have minimum distance 0.
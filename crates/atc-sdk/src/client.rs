@@ -80,6 +80,14 @@ struct AckRequest {
 impl AtcClient {
     /// Create a new ATC client.
     pub fn new(base_url: impl Into<String>) -> Self {
+        Self::with_http_client(base_url, reqwest::Client::new())
+    }
+
+    /// Create a client on an existing `reqwest::Client`.
+    ///
+    /// Clients built this way share one connection pool, so simulators driving
+    /// many drones against the same server reuse connections across drones.
+    pub fn with_http_client(base_url: impl Into<String>, client: reqwest::Client) -> Self {
         Self {
             base_url: base_url.into(),
             drone_id: None,
@@ -87,7 +95,7 @@ impl AtcClient {
             session_token: None,
             registration_token: None,
             admin_token: None,
-            client: reqwest::Client::new(),
+            client,
         }
     }
 
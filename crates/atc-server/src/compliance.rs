@@ -3,7 +3,7 @@
 use crate::cache;
 use crate::config::Config;
 use atc_core::models::FlightPlanRequest;
-use atc_core::spatial::{meters_per_deg_lat, meters_per_deg_lon};
+use atc_core::spatial::{haversine_distance, meters_per_deg_lat, meters_per_deg_lon};
 use chrono::Utc;
 use dashmap::DashMap;
 use reqwest::Client;
@@ -410,7 +410,8 @@ fn build_route_metrics(
     }
     let mut distance_m = 0.0;
     for idx in 1..points.len() {
-        distance_m += haversine_distance_m(points[idx - 1], points[idx]);
+        let (a, b) = (points[idx - 1], points[idx]);
+        distance_m += haversine_distance(a.lat, a.lon, b.lat, b.lon);
     }
     let speed = cruise_speed_mps.unwrap_or(0.0);
     let effective_speed = (speed - wind_mps).max(0.1);
@@ -1224,7 +1225,7 @@ fn geometry_to_polygon(geometry: &[OverpassGeometryPoint]) -> Option<Vec<[f64; 2
 fn footprint_radius_m(center_lat: f64, center_lon: f64, polygon: &[[f64; 2]]) -> f64 {
     let mut max = 0.0;
     for vertex in polygon {
-        let distance = haversine_distance_latlon(center_lat, center_lon, vertex[0], vertex[1]);
+        let distance = haversine_distance(center_lat, center_lon, vertex[0], vertex[1]);
         if distance > max {
             max = distance;
         }
@@ -1232,17 +1233,6 @@ fn footprint_radius_m(center_lat: f64, center_lon: f64, polygon: &[[f64; 2]]) ->
     max
 }
 
-fn haversine_distance_latlon(lat1: f64, lon1: f64, lat2: f64, lon2: f64) -> f64 {
-    let r = 6_371_000.0_f64;
-    let lat1 = lat1.to_radians();
-    let lat2 = lat2.to_radians();
-    let dlat = lat2 - lat1;
-    let dlon = (lon2 - lon1).to_radians();
-    let a = (dlat / 2.0).sin().powi(2) + lat1.cos() * lat2.cos() * (dlon / 2.0).sin().powi(2);
-    let c = 2.0 * a.sqrt().atan2((1.0 - a).sqrt());
-    r * c
-}
-
 fn classify_density(density: f64) -> String {
     if !density.is_finite() {
         return "unknown".to_string();
@@ -1304,16 +1294,6 @@ fn distance_to_route_meters(hazard_lat: f64, hazard_lon: f64, points: &[RoutePoi
     min
 }
 
-fn haversine_distance_m(a: RoutePoint, b: RoutePoint) -> f64 {
-    let lat1 = a.lat.to_radians();
-    let lat2 = b.lat.to_radians();
-    let dlat = lat2 - lat1;
-    let dlon = (b.lon - a.lon).to_radians();
-    let h = (dlat / 2.0).sin().powi(2) + lat1.cos() * lat2.cos() * (dlon / 2.0).sin().powi(2);
-    let c = 2.0 * h.sqrt().asin();
-    6_371_000.0 * c
-}
-
 fn default_hazards() -> Vec<ObstacleHazard> {
     vec![
         ObstacleHazard {
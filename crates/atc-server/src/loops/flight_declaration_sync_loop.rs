@@ -9,6 +9,7 @@ use std::time::Duration;
 use atc_blender::BlenderClient;
 use atc_core::models::{FlightPlan, FlightPlanMetadata, FlightStatus, Waypoint};
 use chrono::{DateTime, Utc};
+use serde::Deserialize;
 use serde_json::Value;
 use tokio::sync::broadcast;
 use tokio::time::interval;
@@ -162,7 +163,9 @@ fn declaration_to_plan(declaration: &Value, declaration_id: &str) -> Option<Flig
     let compliance = properties.get("compliance");
     let atc_plan = compliance
         .and_then(|value| value.get("atc_plan"))
-        .and_then(|value| serde_json::from_value::<AtcPlanEmbed>(value.clone()).ok());
+        // Deserialize straight from the borrowed tree; `from_value` would need a
+        // deep clone of the embed, trajectory log included.
+        .and_then(|value| AtcPlanEmbed::deserialize(value).ok());
 
     if coordinates.is_empty()
         && atc_plan
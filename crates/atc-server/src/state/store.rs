@@ -784,7 +784,7 @@ impl AppState {
     }
 
     fn update_conflicts_from_detector(&self, detector: &mut ConflictDetector) {
-        let new_conflicts = detector.detect_conflicts();
+        let new_conflicts = detector.detect_conflicts_incremental();
 
         self.conflicts.clear();
         for conflict in new_conflicts {
@@ -0,0 +1,48 @@
+"""Keep-alive HTTP helper shared by the scripts in this directory."""
+import http.client
+import threading
+import urllib.parse
+
+# One keep-alive connection per (thread, host): repeated calls skip the TCP/TLS
+# handshake that urlopen pays on every request.
+_local = threading.local()
+_RETRYABLE = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+def _connection(parts):
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    key = (parts.scheme, parts.netloc)
+    conn = conns.get(key)
+    if conn is None:
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=10)
+        else:
+            conn = http.client.HTTPConnection(parts.netloc, timeout=10)
+        conns[key] = conn
+    return key, conn
+
+
+def send_request(url, method="GET", data=None, headers=None):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    request_headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+    if headers:
+        request_headers.update(headers)
+
+    # A pooled connection may have been closed by the server while idle;
+    # retry once on a fresh one before giving up.
+    for attempt in range(2):
+        key, conn = _connection(parts)
+        try:
+            conn.request(method, path, body=data, headers=request_headers)
+            resp = conn.getresponse()
+            return resp.status, resp.read().decode("utf-8")
+        except Exception as exc:
+            conn.close()
+            _local.conns.pop(key, None)
+            if attempt or not isinstance(exc, _RETRYABLE):
+                raise
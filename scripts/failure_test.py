@@ -2,25 +2,15 @@
 import argparse
 import datetime as dt
 import json
-import urllib.request
-import urllib.error
+
+from _http import send_request
 
 
 def request_json(url, method="GET", payload=None, headers=None):
     data = None
     if payload is not None:
         data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, data=data, method=method)
-    req.add_header("Content-Type", "application/json")
-    if headers:
-        for key, value in headers.items():
-            req.add_header(key, value)
-    try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            body = resp.read().decode("utf-8")
-        return resp.status, body
-    except urllib.error.HTTPError as exc:
-        return exc.code, exc.read().decode("utf-8")
+    return send_request(url, method=method, data=data, headers=headers)
 
 
 def main():
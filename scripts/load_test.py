@@ -1,22 +1,32 @@
 #!/usr/bin/env python3
 import argparse
-import datetime as dt
+import asyncio
 import json
 import random
-import threading
+import ssl
 import time
-import urllib.request
+import urllib.parse
+
+from _http import send_request
+
+# Telemetry has a fixed shape, so each tick fills a format string instead of
+# building a dict and running it through json.dumps. %(drone_id)s is filled once
+# per drone with an already JSON-encoded string.
+TELEMETRY_TEMPLATE = (
+    '{"drone_id":%(drone_id)s,"lat":%%.6f,"lon":%%.6f,"altitude_m":%%.2f,'
+    '"heading_deg":%%.2f,"speed_mps":%%.2f,"timestamp":"%%s"}'
+)
+REQUEST_TIMEOUT_S = 10
 
 
 def post_json(url, payload, headers=None):
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, data=data, method="POST")
-    req.add_header("Content-Type", "application/json")
-    if headers:
-        for key, value in headers.items():
-            req.add_header(key, value)
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        body = resp.read().decode("utf-8")
+    return post_body(url, json.dumps(payload).encode("utf-8"), headers=headers)
+
+
+def post_body(url, data, headers=None):
+    status, body = send_request(url, method="POST", data=data, headers=headers)
+    if status >= 400:
+        raise RuntimeError(f"HTTP {status}: {body[:160]}")
     return body
 
 
@@ -30,27 +40,138 @@ def register_drone(base_url, drone_id, registration_token=None, owner_id=None):
     return json.loads(body)
 
 
-def telemetry_loop(base_url, drone_id, token, duration_s, interval_s, center_lat, center_lon):
-    end_time = time.time() + duration_s
-    url = f"{base_url}/v1/telemetry"
-    headers = {"Authorization": f"Bearer {token}"}
-    while time.time() < end_time:
-        lat = center_lat + random.uniform(-0.001, 0.001)
-        lon = center_lon + random.uniform(-0.001, 0.001)
-        payload = {
-            "drone_id": drone_id,
-            "lat": lat,
-            "lon": lon,
-            "altitude_m": random.uniform(60, 120),
-            "heading_deg": random.uniform(0, 360),
-            "speed_mps": random.uniform(5, 15),
-            "timestamp": dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
-        }
-        try:
-            post_json(url, payload, headers=headers)
-        except Exception as exc:
-            print(f"[{drone_id}] telemetry failed: {exc}")
-        time.sleep(interval_s)
+class TelemetryConnection:
+    """One keep-alive connection per drone, driven by the event loop.
+
+    Telemetry is sent with asyncio streams rather than a blocking client in a
+    thread pool, so the number of OS threads does not grow with --drones.
+    """
+
+    def __init__(self, base_url, token):
+        parts = urllib.parse.urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.https else 80)
+        self.path = f"{parts.path.rstrip('/')}/v1/telemetry"
+        self.head = (
+            f"POST {self.path} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Authorization: Bearer {token}\r\n"
+            "Connection: keep-alive\r\n"
+        ).encode("latin-1")
+        self.reader = None
+        self.writer = None
+
+    async def _connect(self):
+        context = ssl.create_default_context() if self.https else None
+        self.reader, self.writer = await asyncio.open_connection(
+            self.host, self.port, ssl=context
+        )
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+        self.reader = self.writer = None
+
+    async def post(self, body):
+        data = body.encode("utf-8")
+        request = self.head + b"Content-Length: %d\r\n\r\n" % len(data) + data
+        # The server may have closed the idle connection since the last tick;
+        # retry once on a fresh one before giving up.
+        for attempt in range(2):
+            reused = self.writer is not None
+            try:
+                if not reused:
+                    await self._connect()
+                self.writer.write(request)
+                await self.writer.drain()
+                return await asyncio.wait_for(self._read_response(), REQUEST_TIMEOUT_S)
+            except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                await self.close()
+                if attempt or not reused:
+                    raise RuntimeError(f"connection failed: {exc!r}") from exc
+            except BaseException:
+                await self.close()
+                raise
+
+    async def _read_response(self):
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            body = b"".join(chunks)
+        else:
+            body = await self.reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        if status >= 400:
+            raise RuntimeError(f"HTTP {status}: {body[:160].decode('utf-8', 'replace')}")
+        return body
+
+
+async def telemetry_loop(
+    base_url, drone_id, token, duration_s, interval_s, center_lat, center_lon
+):
+    loop = asyncio.get_running_loop()
+    end_time = loop.time() + duration_s
+    conn = TelemetryConnection(base_url, token)
+    template = TELEMETRY_TEMPLATE % {"drone_id": json.dumps(drone_id)}
+    try:
+        while loop.time() < end_time:
+            body = template % (
+                center_lat + random.uniform(-0.001, 0.001),
+                center_lon + random.uniform(-0.001, 0.001),
+                random.uniform(60, 120),
+                random.uniform(0, 360),
+                random.uniform(5, 15),
+                time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            )
+            try:
+                await conn.post(body)
+            except Exception as exc:
+                print(f"[{drone_id}] telemetry failed: {exc!r}")
+            await asyncio.sleep(interval_s)
+    finally:
+        await conn.close()
+
+
+async def run_telemetry(args, tokens, interval_s):
+    # Drones are coroutines on one event loop, each with its own socket; no
+    # worker threads, so one process can drive a large simulated fleet.
+    await asyncio.gather(
+        *(
+            telemetry_loop(
+                args.base_url,
+                drone_id,
+                token,
+                args.duration,
+                interval_s,
+                args.center_lat,
+                args.center_lon,
+            )
+            for drone_id, token in tokens
+        )
+    )
 
 
 def main():
@@ -79,26 +200,7 @@ def main():
         )
         tokens.append((drone_id, response["session_token"]))
 
-    threads = []
-    for drone_id, token in tokens:
-        thread = threading.Thread(
-            target=telemetry_loop,
-            args=(
-                args.base_url,
-                drone_id,
-                token,
-                args.duration,
-                interval_s,
-                args.center_lat,
-                args.center_lon,
-            ),
-            daemon=True,
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
+    asyncio.run(run_telemetry(args, tokens, interval_s))
 
     print("Load test complete.")
 